@@ -0,0 +1,91 @@
+"""
+Benchmark the changelog loaders on a large generated file.
+
+Run with `uv run python benchmarks/bench_load.py [N_VERSIONS]`.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from changelogtxt_parser import serdes
+from changelogtxt_parser.version import parse_version
+
+# ruff: noqa: T201, S101, INP001 a script printing its timings
+
+REPEAT = 3
+
+
+def _write_changelog(path: Path, n_versions: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write("- An unreleased change\n\n")
+        for i in range(n_versions, 0, -1):
+            f.write(f"v{i // 100}.{i % 100}.0\n")
+            f.write(f"- Fix bug number {i} in the parser\n")
+            f.write("- A longer change message that was wrapped\n")
+            f.write("  over two lines by the formatter\n\n")
+
+
+def _load_text_mode(file_path: str) -> list:
+    """Return the entries like `serdes.load` did before reading binary blocks."""
+    entries: list = []
+    with Path(file_path).open("r", encoding="utf-8") as f:
+        for line_no, raw in enumerate(f, start=1):
+            line = raw.strip()
+            if not line:
+                continue
+            if parse_version(line):
+                entries.append({"version": line, "changes": []})
+            elif line.startswith("-"):
+                change = line.lstrip("-").strip()
+                if not change:
+                    raise ValueError(f"Empty change at line {line_no}")
+                if not entries:
+                    entries.append({"version": "", "changes": []})
+                entries[-1]["changes"].append(change)
+            elif entries and entries[-1]["changes"]:
+                entries[-1]["changes"][-1] += f" {line}"
+            else:
+                raise ValueError(f"Unexpected text at line {line_no}")
+    return entries
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Time each loader on the same file and check they agree."""
+    n_versions = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "CHANGELOG.txt"
+        _write_changelog(path, n_versions)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"{n_versions} versions, {size_mb:.1f} MiB")
+
+        expected = _load_text_mode(str(path))
+        seconds = _best_of(lambda: _load_text_mode(str(path)))
+        print(f"{'load (text mode)':<24}{seconds:8.3f}s")
+
+        assert serdes.load(str(path)) == expected
+        print(f"{'load':<24}{_best_of(lambda: serdes.load(str(path))):8.3f}s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            assert serdes.load_parallel(str(path), workers=workers) == expected
+            seconds = _best_of(
+                lambda w=workers: serdes.load_parallel(str(path), workers=w),
+            )
+            print(f"{f'load_parallel({workers})':<24}{seconds:8.3f}s")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
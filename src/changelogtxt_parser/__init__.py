@@ -1,13 +1,39 @@
 # SPDX-License-Identifier: MIT
 """ChangelogTXT Parser Module."""
 
-from changelogtxt_parser.app import get_tag, summarize_news, update
-from changelogtxt_parser.serdes import dump, load
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from changelogtxt_parser.app import get_tag, summarize_news, update
+    from changelogtxt_parser.fulltext import search
+    from changelogtxt_parser.serdes import dump, load
 
 __all__ = [
     "dump",
     "get_tag",
     "load",
+    "search",
     "summarize_news",
     "update",
 ]
+
+# The functions are imported on first use, so that the CLI talking to a running
+# server does not import the parser.
+_MODULES = {
+    "dump": "serdes",
+    "get_tag": "app",
+    "load": "serdes",
+    "search": "fulltext",
+    "summarize_news": "app",
+    "update": "app",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_MODULES[name]}")
+    return getattr(module, name)
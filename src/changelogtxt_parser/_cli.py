@@ -1,18 +1,22 @@
 import argparse
+import pathlib
 import pprint
 import sys
 from typing import Any
 
 import logistro
 
-from changelogtxt_parser import app, serdes
-
 # ruff: noqa: T201 allow print in CLI
 
+# The package modules are imported by the commands using them, so that a request
+# to a running server with --socket does not pay for importing the parser.
+
 DEFAULT_FILE = "./CHANGELOG.txt"
+# `jsonio.FORMATS`, spelled out to keep jsonio out of the other commands
+_FORMATS = ("json", "jsonl")
 
 
-def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:
+def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:  # noqa: PLR0915
     description = """changelogtxt helps you manage your changelog file.
 
     changelogtxt COMMAND --help for information about commands.
@@ -25,6 +29,16 @@ def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:
         description=description,
     )
 
+    parser.add_argument(
+        "--socket",
+        help=(
+            "Unix socket of a `changelogtxt serve` process. If given, commands "
+            "are answered by that server instead of this process."
+        ),
+        required=False,
+        default=None,
+    )
+
     subparsers = parser.add_subparsers(dest="command")
 
     get_tag = subparsers.add_parser(
@@ -50,6 +64,22 @@ def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:
         help="Check changelog format.",
     )
     check_format.add_argument(
+        "-f",
+        "--file",
+        help='Optional file path, "-" reads the standard input.',
+        required=False,
+        default=DEFAULT_FILE,
+    )
+
+    check_order = subparsers.add_parser(
+        "check-order",
+        description=(
+            "Verify that versions in the changelog are listed newest first and "
+            'without duplicates, e.g. "v1.0" and "1.0.0".'
+        ),
+        help="Check changelog version order.",
+    )
+    check_order.add_argument(
         "-f",
         "--file",
         help="Optional file path.",
@@ -70,6 +100,28 @@ def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:
         "target",
         help="Second changelog file path.",
     )
+    tree_mode = compare_files.add_mutually_exclusive_group()
+    tree_mode.add_argument(
+        "--tree",
+        action="store_true",
+        help="Source and target are directories, compare every changelog in them.",
+    )
+    tree_mode.add_argument(
+        "--revisions",
+        action="store_true",
+        help=(
+            "Source and target are git revisions, compare every changelog "
+            "changed between them."
+        ),
+    )
+    compare_files.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of processes comparing changelogs with --tree or --revisions.",
+        type=int,
+        required=False,
+        default=None,
+    )
     update = subparsers.add_parser(
         "update",
         description="Add a new change message to the specified version.",
@@ -105,11 +157,187 @@ def _get_cli_args() -> tuple[argparse.ArgumentParser, dict[str, Any]]:
         help="Force parse the version",
     )
 
+    search_changes = subparsers.add_parser(
+        "search",
+        description=(
+            "Find the changes containing every term of the query. Quote terms "
+            "to match a phrase, e.g. 'security \"pin requests\"'."
+        ),
+        help="Search change messages.",
+    )
+    search_changes.add_argument(
+        "query",
+        help="Terms to look for.",
+    )
+    search_changes.add_argument(
+        "files",
+        help="Changelog file paths, defaults to ./CHANGELOG.txt.",
+        nargs="*",
+        default=[DEFAULT_FILE],
+    )
+    search_changes.add_argument(
+        "--since",
+        help="Only search versions greater or equal to this one.",
+        required=False,
+        default=None,
+    )
+    search_changes.add_argument(
+        "--until",
+        help="Only search versions lower or equal to this one.",
+        required=False,
+        default=None,
+    )
+    search_changes.add_argument(
+        "--persist",
+        action="store_true",
+        help="Store the search index next to each file for later runs.",
+    )
+
+    merge_files = subparsers.add_parser(
+        "aggregate",
+        description=(
+            "Merge many changelog files, each ordered newest first, into one "
+            "changelog. Changes of equal versions are combined."
+        ),
+        help="Merge changelog files into one.",
+    )
+    merge_files.add_argument(
+        "output",
+        help="Path of the merged changelog file to write.",
+    )
+    merge_files.add_argument(
+        "files",
+        help="Changelog file paths, or directories containing a CHANGELOG.txt.",
+        nargs="+",
+    )
+    merge_files.add_argument(
+        "--prefix",
+        action="store_true",
+        help="Prefix changes with the directory name of their changelog.",
+    )
+
+    export_json = subparsers.add_parser(
+        "export",
+        description=(
+            "Write the changelog as a JSON array or as JSON Lines, one version "
+            "per line. Versions are written as they are parsed."
+        ),
+        help="Export the changelog to JSON.",
+    )
+    export_json.add_argument(
+        "-f",
+        "--file",
+        help='Optional file path, "-" reads the standard input.',
+        required=False,
+        default=DEFAULT_FILE,
+    )
+    export_json.add_argument(
+        "-o",
+        "--output",
+        help="Path of the JSON file to write, defaults to the standard output.",
+        required=False,
+        default="-",
+    )
+    export_json.add_argument(
+        "--format",
+        help="Output format.",
+        choices=_FORMATS,
+        default="json",
+    )
+
+    import_json = subparsers.add_parser(
+        "import",
+        description=(
+            "Write the changelog from a JSON array or JSON Lines, as written by export."
+        ),
+        help="Import the changelog from JSON.",
+    )
+    import_json.add_argument(
+        "input",
+        help='Path of the JSON file to read, "-" reads the standard input.',
+    )
+    import_json.add_argument(
+        "-f",
+        "--file",
+        help="Optional file path.",
+        required=False,
+        default=DEFAULT_FILE,
+    )
+    import_json.add_argument(
+        "--format",
+        help="Input format.",
+        choices=_FORMATS,
+        default="json",
+    )
+    import_json.add_argument(
+        "--strict",
+        action="store_true",
+        help="Force parse the versions",
+    )
+
+    build_index = subparsers.add_parser(
+        "index",
+        description=(
+            "Write a CHANGELOG.txt.idx index next to the changelog, so get-tag "
+            "only parses the section it needs. It is kept up to date by update."
+        ),
+        help="Write a sidecar index of the changelog.",
+    )
+    build_index.add_argument(
+        "-f",
+        "--file",
+        help="Optional file path.",
+        required=False,
+        default=DEFAULT_FILE,
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        description=(
+            "Keep parsed changelogs in memory and answer get-tag, check-format, "
+            "update and summarize-news requests over a Unix socket."
+        ),
+        help="Run a resident server, see --socket.",
+    )
+    serve.add_argument(
+        "--idle-timeout",
+        help="Stop after this many seconds without requests.",
+        type=float,
+        required=False,
+        default=None,
+    )
+
+    watch_files = subparsers.add_parser(
+        "watch",
+        description="Re-validate changelog files every time they change.",
+        help="Check format of changelog files on every change.",
+    )
+    watch_files.add_argument(
+        "files",
+        help="Changelog file paths, defaults to ./CHANGELOG.txt.",
+        nargs="*",
+        default=[DEFAULT_FILE],
+    )
+    watch_files.add_argument(
+        "--interval",
+        help="Seconds between two checks for changes.",
+        type=float,
+        required=False,
+        default=0.5,
+    )
+
     basic_args = parser.parse_args()
     return parser, vars(basic_args)
 
 
-def run_cli() -> None:
+def _print_check(file: pathlib.Path, error: str | None) -> None:
+    if error:
+        print(f"{file!s}: {error}", file=sys.stderr, flush=True)
+    else:
+        print(f"{file!s}: Changelog format validation was successful.", flush=True)
+
+
+def run_cli() -> None:  # noqa: C901, PLR0912, PLR0915 one branch per command
     parser, cli_args = _get_cli_args()
     tag = cli_args.pop("tag", "")
     file = cli_args.pop("file", "")
@@ -118,26 +346,149 @@ def run_cli() -> None:
     message = cli_args.pop("message", None)
     force = cli_args.pop("force", "")
     strict = cli_args.pop("strict", "")
+    socket_path = cli_args.pop("socket", None)
+    idle_timeout = cli_args.pop("idle_timeout", None)
+    files = cli_args.pop("files", [])
+    interval = cli_args.pop("interval", 0.5)
+    query = cli_args.pop("query", "")
+    since = cli_args.pop("since", None)
+    until = cli_args.pop("until", None)
+    persist = cli_args.pop("persist", False)
+    output = cli_args.pop("output", "")
+    tree_mode = cli_args.pop("tree", False)
+    revisions = cli_args.pop("revisions", False)
+    jobs = cli_args.pop("jobs", None)
+    prefix = cli_args.pop("prefix", False)
+    input_path = cli_args.pop("input", "-")
+    fmt = cli_args.pop("format", "json")
     command = cli_args.pop("command", None)
 
     match command:
         case "get-tag":
-            version_entry = app.get_tag(tag, file)
+            if socket_path:
+                from changelogtxt_parser import client
+
+                version_entry = client.request(
+                    command,
+                    socket_path,
+                    tag=tag,
+                    file=file,
+                )
+            else:
+                from changelogtxt_parser import app
+
+                version_entry = app.get_tag(tag, file)
             print(version_entry.get("version"))
             print("\n".join(f"- {c}" for c in version_entry["changes"]))
         case "check-format":
-            serdes.load(file)
+            if socket_path:
+                from changelogtxt_parser import client
+
+                client.request(command, socket_path, file=file)
+            else:
+                from changelogtxt_parser import serdes
+
+                serdes.load(file)
             print("Changelog format validation was successful.")
+        case "check-order":
+            from changelogtxt_parser import app
+
+            app.check_order(file)
+            print("Changelog order validation was successful.")
+        case "summarize-news" if tree_mode or revisions:
+            from changelogtxt_parser import tree
+
+            summarize = tree.summarize_dirs if tree_mode else tree.summarize_revisions
+            report = summarize(source_file, target_file, workers=jobs)
+            if report:
+                pprint.pp(report)
+            else:
+                print("No changes found", file=sys.stderr)
+                sys.exit(1)
         case "summarize-news":
-            diff = app.summarize_news(source_file, target_file)
+            if socket_path:
+                from changelogtxt_parser import client
+
+                diff = client.request(
+                    command,
+                    socket_path,
+                    source=source_file,
+                    target=target_file,
+                )
+            else:
+                from changelogtxt_parser import app
+
+                diff = app.summarize_news(source_file, target_file)
             if any(diff):
                 pprint.pp(diff)
             else:
                 print("No changes found", file=sys.stderr)
                 sys.exit(1)
         case "update":
-            app.update(tag, message, file, force=force, strict=strict)
+            if socket_path:
+                from changelogtxt_parser import client
+
+                client.request(
+                    command,
+                    socket_path,
+                    tag=tag,
+                    message=message,
+                    file=file,
+                    force=force,
+                    strict=strict,
+                )
+            else:
+                from changelogtxt_parser import app
+
+                app.update(tag, message, file, force=force, strict=strict)
             print(f"File update was successful and generated at: {file}")
+        case "search":
+            from changelogtxt_parser import fulltext
+
+            results = fulltext.search(
+                query,
+                files,
+                since=since,
+                until=until,
+                persist=persist,
+            )
+            for result in results:
+                print(f"{result['file']}:{result['version']}: - {result['change']}")
+            if not results:
+                print("No changes found", file=sys.stderr)
+                sys.exit(1)
+        case "aggregate":
+            from changelogtxt_parser import aggregate
+
+            aggregate.aggregate(files, output, prefix=prefix)
+            print(f"Merged changelog was generated at: {output}")
+        case "export":
+            from changelogtxt_parser import jsonio
+
+            jsonio.export(file, output, fmt=fmt)
+        case "import":
+            from changelogtxt_parser import jsonio
+
+            jsonio.import_(input_path, file, fmt=fmt, strict=strict)
+            print(f"File import was successful and generated at: {file}")
+        case "index":
+            from changelogtxt_parser import serdes
+
+            print(f"Index was generated at: {serdes.build_index(file)}")
+        case "serve":
+            from changelogtxt_parser import client, server
+
+            server.serve(
+                socket_path or client.DEFAULT_SOCKET,
+                idle_timeout=idle_timeout,
+            )
+        case "watch":
+            from changelogtxt_parser import watch
+
+            try:
+                watch.watch(files, interval=interval, callback=_print_check)
+            except KeyboardInterrupt:
+                pass
         case _:
             print("No command supplied.", file=sys.stderr)
             parser.print_help()
@@ -0,0 +1,113 @@
+"""Aggregate Module: merge many changelogs into one release log."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from changelogtxt_parser import _utils, serdes
+from changelogtxt_parser import version as version_tools
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Iterator
+
+
+def newest_first(entry: version_tools.VersionEntry) -> tuple[Any, ...]:
+    """
+    Return the default merge key: unreleased changes, then by `sort_key`.
+
+    Args:
+        entry: A `VersionEntry`.
+
+    """
+    if not entry["version"]:
+        return (1,)
+    return (0, version_tools.sort_key(entry["version"]))
+
+
+def _prefixed(
+    entries: Iterable[version_tools.VersionEntry],
+    prefix: str,
+) -> Iterator[version_tools.VersionEntry]:
+    for entry in entries:
+        yield {
+            "version": entry["version"],
+            "changes": [f"{prefix}: {change}" for change in entry["changes"]],
+        }
+
+
+def merge(
+    file_paths: Iterable[str],
+    *,
+    key: Callable[[version_tools.VersionEntry], Any] = newest_first,
+    reverse: bool = True,
+    prefix: bool = False,
+) -> Iterator[version_tools.VersionEntry]:
+    """
+    Merge changelog files lazily into one stream of version entries.
+
+    Each file is read with `serdes.iter_load` and must already be ordered by
+    `key` (newest first by default, see `app.check_order`). All consecutive
+    entries of the merged stream with equal keys are combined into one, whether
+    they come from different files or from the same file (e.g. "v1.0" and
+    "1.0.0"): the first entry and its version header are kept, and the changes
+    of the others are appended to it, in the order of `file_paths` and then of
+    each file. Only one entry per file is held in memory at a time.
+
+    Args:
+        file_paths: Paths of the changelog files to merge.
+        key: Function returning the merge key of an entry.
+        reverse: If True, files are ordered from the greatest key down.
+        prefix: If True, prepend each change with the name of the directory of
+            its changelog file, e.g. "- parser: Fix bug".
+
+    Returns:
+        An iterator of `VersionEntry`.
+
+    """
+    opened: list[Generator[version_tools.VersionEntry, None, None]] = []
+    try:
+        streams = []
+        for file_path in file_paths:
+            file = _utils.resolve_file_path(file_path)
+            entries = serdes.iter_load(str(file))
+            opened.append(entries)
+            streams.append(_prefixed(entries, file.parent.name) if prefix else entries)
+
+        merged = heapq.merge(*streams, key=key, reverse=reverse)
+        for _, group in itertools.groupby(merged, key=key):
+            first, *others = group
+            for entry in others:
+                first["changes"].extend(entry["changes"])
+            yield first
+    finally:
+        # close the files of a merge that stopped early
+        for entries in opened:
+            entries.close()
+
+
+def aggregate(
+    file_paths: Iterable[str],
+    output_path: str,
+    *,
+    key: Callable[[version_tools.VersionEntry], Any] = newest_first,
+    reverse: bool = True,
+    prefix: bool = False,
+) -> None:
+    """
+    Write the merge of many changelog files to one changelog, see `merge`.
+
+    Args:
+        file_paths: Paths of the changelog files to merge.
+        output_path: Path to the file where the merged changelog will be written.
+        key: Function returning the merge key of an entry.
+        reverse: If True, files are ordered from the greatest key down.
+        prefix: If True, prepend each change with the name of the directory of
+            its changelog file.
+
+    """
+    serdes.dump(
+        merge(file_paths, key=key, reverse=reverse, prefix=prefix),
+        output_path,
+    )
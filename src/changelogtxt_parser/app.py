@@ -15,6 +15,9 @@ def update(
     """
     Create a new version entry if it doesn't exist.
 
+    The rest of the changelog is written back as it was, see
+    `serdes.load_sections`.
+
     Args:
         version: Version identifier to update or create in the changelog.
         message: Change message to add under the specified version.
@@ -39,7 +42,8 @@ def update(
     else:
         new_version = version
 
-    entries: list[version_tools.VersionEntry] = serdes.load(file_path)
+    sections = serdes.load_sections(file_path)
+    entries = [section.entry for section in sections]
 
     if not entries:
         entries = [{"version": "", "changes": []}]
@@ -63,13 +67,16 @@ def update(
     if message:
         current_changes.insert(0, message)
 
-    serdes.dump(entries, file_path)
+    serdes.dump(entries, file_path, sections=sections)
 
 
 def get_tag(tag: str, file_path: str) -> version_tools.VersionEntry:
     """
     Return a VersionEntry from the tag in the changelog file.
 
+    If the file has a sidecar index (see `serdes.build_index`), only the section
+    of the tag is parsed.
+
     Args:
         tag: The version tag to validate (e.g., "1.2.3" or "v1.2.3").
         file_path: Path to the changelog file to search within.
@@ -78,14 +85,10 @@ def get_tag(tag: str, file_path: str) -> version_tools.VersionEntry:
         ValueError: If the specified tag is not found in the changelog.
 
     """
-    entries = serdes.load(file_path)
-    target_ver = version_tools.parse_version(tag)
-
-    for entry in entries:
-        current_ver = version_tools.parse_version(entry["version"])
-        if current_ver == target_ver:
-            return entry
-    raise ValueError(f"Tag '{tag}' not found in changelog.")
+    entry = serdes.load_section(file_path, tag)
+    if entry is None:
+        raise ValueError(f"Tag '{tag}' not found in changelog.")
+    return entry
 
 
 def summarize_news(
@@ -104,9 +107,27 @@ def summarize_news(
         found, or an empty list if the files are equivalent.
 
     """
-    src = serdes.load(source_file_path)
-    trg = serdes.load(target_file_path)
+    return compare_entries(
+        serdes.load(source_file_path),
+        serdes.load(target_file_path),
+    )
+
+
+def compare_entries(
+    src: list[version_tools.VersionEntry],
+    trg: list[version_tools.VersionEntry],
+) -> tuple[set[str], dict[str, set[str]]]:
+    """
+    Compare two already loaded changelogs, see `summarize_news`.
 
+    Args:
+        src: Entries of the original changelog.
+        trg: Entries of the updated changelog to compare against.
+
+    Returns:
+        The new versions and the new changes per existing version.
+
+    """
     src_dict = {entry["version"]: entry["changes"] for entry in src}
     trg_dict = {entry["version"]: entry["changes"] for entry in trg}
 
@@ -117,3 +138,58 @@ def summarize_news(
             new_changes[v] = c
 
     return new_versions, new_changes
+
+
+def sort_entries(
+    entries: list[version_tools.VersionEntry],
+) -> list[version_tools.VersionEntry]:
+    """
+    Return the entries sorted newest first, with unreleased changes on top.
+
+    Versions are compared with `version.sort_key`, so versions parsed by
+    different libraries can be sorted together.
+
+    Args:
+        entries: A list of `VersionEntry` as returned by `serdes.load`.
+
+    Raises:
+        ValueError: If a version cannot be parsed.
+
+    """
+    unreleased = [e for e in entries if not e["version"]]
+    released = [e for e in entries if e["version"]]
+    released.sort(key=lambda e: version_tools.sort_key(e["version"]), reverse=True)
+    return unreleased + released
+
+
+def check_order(file_path: str) -> None:
+    """
+    Verify that versions are listed newest first and without duplicates.
+
+    Two versions are duplicates if they compare equal, e.g. "v1.0" and "1.0.0".
+
+    Args:
+        file_path: Path to the changelog file to check.
+
+    Raises:
+        ValueError: Listing every version out of order or duplicated.
+
+    """
+    entries = serdes.load(file_path)
+    versions = [e["version"] for e in entries if e["version"]]
+    keys = [version_tools.sort_key(v) for v in versions]
+
+    errors = []
+    seen: dict[version_tools.SortKey, str] = {}
+    for i, (version, key) in enumerate(zip(versions, keys, strict=True)):
+        if key in seen:
+            errors.append(f"{version} duplicates {seen[key]}")
+            continue
+        seen[key] = version
+        if i and key > keys[i - 1]:
+            errors.append(f"{version} is listed after older {versions[i - 1]}")
+
+    if errors:
+        raise ValueError(
+            "Invalid changelog order:\n" + "\n".join(f"- {e}" for e in errors),
+        )
@@ -0,0 +1,83 @@
+"""Client Module for the resident changelogtxt server."""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import socket
+import tempfile
+from typing import Any
+
+DEFAULT_SOCKET = str(
+    pathlib.Path(tempfile.gettempdir()) / f"changelogtxt-{os.getuid()}.sock",
+)
+
+_PATH_PARAMS = ("file", "source", "target")
+
+_ERRORS: dict[str, type[Exception]] = {
+    "FileNotFoundError": FileNotFoundError,
+    "PermissionError": PermissionError,
+    "RuntimeError": RuntimeError,
+    "TypeError": TypeError,
+    "ValueError": ValueError,
+}
+
+
+def request(
+    command: str,
+    socket_path: str = DEFAULT_SOCKET,
+    *,
+    timeout: float | None = None,
+    **params: Any,
+) -> Any:
+    """
+    Send one request to a running `changelogtxt serve` process.
+
+    Relative file paths are made absolute here, since the server does not share
+    the working directory of the caller. For the same reason "-" (the standard
+    input) is rejected.
+
+    Args:
+        command: One of "get-tag", "check-format", "update", "summarize-news",
+            "ping" or "shutdown".
+        socket_path: Path to the Unix domain socket the server listens on.
+        timeout: Optional timeout in seconds for connecting and answering.
+        params: Arguments of the command, named like the CLI options.
+
+    Returns:
+        The result of the command, with the same shape as the `app` function.
+
+    Raises:
+        ValueError: If a file path is "-".
+        ValueError, TypeError, RuntimeError, FileNotFoundError, PermissionError:
+            Re-raised from the server, other errors as RuntimeError.
+
+    """
+    for key in _PATH_PARAMS:
+        if str(params.get(key)) == "-":
+            raise ValueError("The server cannot read the standard input of a client.")
+        if params.get(key):
+            params[key] = str(pathlib.Path(params[key]).expanduser().absolute())
+
+    payload = json.dumps({"command": command, **params}).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(payload)
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise RuntimeError("Server closed the connection without answering.")
+
+    response = json.loads(line)
+
+    if not response["ok"]:
+        error = response["error"]
+        raise _ERRORS.get(error["type"], RuntimeError)(error["message"])
+
+    result = response["result"]
+    if command == "summarize-news":
+        new_versions, new_changes = result
+        return set(new_versions), {v: set(c) for v, c in new_changes.items()}
+    return result
@@ -0,0 +1,344 @@
+"""Full-text Search Module over change messages."""
+
+from __future__ import annotations
+
+import array
+import bisect
+import re
+import shlex
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
+
+import logistro
+
+from changelogtxt_parser import _utils, serdes
+from changelogtxt_parser import version as version_tools
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+_logger = logistro.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+# looking a term up in one change costs about as much as going through this
+# many of its occurrences
+_LOOKUP_COST = 8
+
+# The persisted index, in native byte order as it is a cache of this machine:
+#
+#     header       magic "CTXS", format (H), `_Index.shift` (H), file mtime (q)
+#                  and size (Q), number of versions, changes, tokens (I) and
+#                  occurrences (Q), size of the text (Q)
+#     versions     version position of each change (I)
+#     bounds       start of the occurrences of each token, then their end (Q)
+#     occurrences  see `_Index.occurrences`, 32 bits wide if they fit
+#     text         the versions, changes and tokens, one per line, in utf-8
+_MAGIC = b"CTXS"
+_FORMAT = 1
+_HEADER = struct.Struct("=4sHHqQIIIQQ")
+
+
+class SearchResult(TypedDict):
+    """
+    A change message matching a search.
+
+    Attributes:
+        file: Path of the changelog file the change is in.
+        version: The version of the change, "" if unreleased.
+        change: The change message.
+
+    """
+
+    file: str
+    version: str
+    change: str
+
+
+@dataclass(slots=True)
+class _Index:
+    """Positional inverted index of the change messages of one changelog file."""
+
+    stamp: tuple[int, int]
+    versions: list[str]
+    changes: list[str]
+    # position in `versions` of the version of each change
+    change_versions: array.array[int]
+    # token -> its number, its occurrences are between two `bounds`
+    tokens: dict[str, int]
+    bounds: array.array[int]
+    # every occurrence of each token, as `change << shift | word position`, in
+    # token number order then file order
+    occurrences: array.array[int]
+    shift: int
+
+    @classmethod
+    def build(cls, file: pathlib.Path, stamp: tuple[int, int]) -> _Index:
+        entries = serdes.load(str(file))
+        changes = [change for entry in entries for change in entry["changes"]]
+        # a change has fewer words than characters, even once lowercased
+        shift = max(len(change) for change in changes).bit_length() if changes else 0
+        versions = [entry["version"] for entry in entries]
+        change_versions = array.array(
+            "I",
+            (n for n, entry in enumerate(entries) for _ in entry["changes"]),
+        )
+
+        found: dict[str, list[int]] = {}
+        for n, change in enumerate(changes):
+            start = n << shift
+            for position, token in enumerate(_tokenize(change)):
+                found.setdefault(token, []).append(start | position)
+        tokens: dict[str, int] = {}
+        bounds = array.array("Q", [0])
+        occurrences = array.array(_typecode(len(changes), shift))
+        for token, positions in found.items():
+            tokens[token] = len(tokens)
+            occurrences.extend(positions)
+            bounds.append(len(occurrences))
+        return cls(
+            stamp,
+            versions,
+            changes,
+            change_versions,
+            tokens,
+            bounds,
+            occurrences,
+            shift,
+        )
+
+    def _span(self, token: str) -> tuple[int, int]:
+        n = self.tokens.get(token)
+        return (0, 0) if n is None else (self.bounds[n], self.bounds[n + 1])
+
+    def _count(self, tokens: list[str]) -> int:
+        return min(hi - lo for lo, hi in map(self._span, tokens))
+
+    def _matches(self, tokens: list[str]) -> set[int]:
+        """Return the changes with the tokens as consecutive words."""
+        lo, hi = self._span(tokens[0])
+        starts = set(self.occurrences[lo:hi])
+        mask = (1 << self.shift) - 1
+        for offset, token in enumerate(tokens[1:], start=1):
+            if not starts:
+                break
+            lo, hi = self._span(token)
+            # the occurrences of the first token followed by this one
+            starts &= {
+                occurrence - offset
+                for occurrence in self.occurrences[lo:hi]
+                if occurrence & mask >= offset
+            }
+        return {start >> self.shift for start in starts}
+
+    def _positions(self, change: int, token: str) -> array.array[int]:
+        lo, hi = self._span(token)
+        start = change << self.shift
+        lo = bisect.bisect_left(self.occurrences, start, lo, hi)
+        hi = bisect.bisect_left(self.occurrences, start + (1 << self.shift), lo, hi)
+        return self.occurrences[lo:hi]
+
+    def _contains(self, change: int, tokens: list[str]) -> bool:
+        """Return whether a change has the tokens as consecutive words."""
+        starts = list(self._positions(change, tokens[0]))
+        for offset, token in enumerate(tokens[1:], start=1):
+            following = set(self._positions(change, token))
+            starts = [start for start in starts if start + offset in following]
+        return bool(starts)
+
+    def find(self, terms: list[list[str]]) -> list[int]:
+        rarest, *others = sorted(terms, key=self._count)
+        candidates = self._matches(rarest)
+        for tokens in others:
+            if not candidates:
+                break
+            # look the term up in each candidate when they are few compared with
+            # its occurrences, else match it everywhere
+            occurrences = sum(hi - lo for lo, hi in map(self._span, tokens))
+            if len(candidates) * _LOOKUP_COST < occurrences:
+                candidates = {i for i in candidates if self._contains(i, tokens)}
+            else:
+                candidates &= self._matches(tokens)
+        return sorted(candidates)
+
+
+def _typecode(n_changes: int, shift: int) -> str:
+    return "I" if n_changes << shift <= 1 << 32 else "Q"
+
+
+_indexes: dict[pathlib.Path, _Index] = {}
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _sidecar_path(file: pathlib.Path) -> pathlib.Path:
+    return file.with_name(f"{file.name}.search")
+
+
+def _read_sidecar(file: pathlib.Path, stamp: tuple[int, int]) -> _Index | None:
+    try:
+        data = _sidecar_path(file).read_bytes()
+        (
+            magic,
+            fmt,
+            shift,
+            mtime,
+            size,
+            n_versions,
+            n_changes,
+            n_tokens,
+            n_occurrences,
+            text_size,
+        ) = _HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    occurrences = array.array(_typecode(n_changes, shift))
+    sizes = [
+        4 * n_changes,
+        8 * (n_tokens + 1),
+        occurrences.itemsize * n_occurrences,
+        text_size,
+    ]
+    if (
+        magic != _MAGIC
+        or fmt != _FORMAT
+        or (mtime, size) != stamp
+        or len(data) != _HEADER.size + sum(sizes)
+    ):
+        return None
+
+    parts = []
+    offset = _HEADER.size
+    for part_size in sizes:
+        parts.append(data[offset : offset + part_size])
+        offset += part_size
+    change_versions = array.array("I", parts[0])
+    bounds = array.array("Q", parts[1])
+    occurrences.frombytes(parts[2])
+    lines = parts[3].decode("utf-8").split("\n")[:-1]
+    versions = lines[:n_versions]
+    changes = lines[n_versions : n_versions + n_changes]
+    tokens = {token: n for n, token in enumerate(lines[n_versions + n_changes :])}
+    return _Index(
+        stamp,
+        versions,
+        changes,
+        change_versions,
+        tokens,
+        bounds,
+        occurrences,
+        shift,
+    )
+
+
+def _write_sidecar(file: pathlib.Path, idx: _Index) -> None:
+    # loaded versions and changes never have line breaks, nor have tokens
+    text = "".join(f"{line}\n" for line in (*idx.versions, *idx.changes, *idx.tokens))
+    encoded = text.encode("utf-8")
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT,
+        idx.shift,
+        *idx.stamp,
+        len(idx.versions),
+        len(idx.changes),
+        len(idx.tokens),
+        len(idx.occurrences),
+        len(encoded),
+    )
+    path = _sidecar_path(file)
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(header)
+            idx.change_versions.tofile(f)
+            idx.bounds.tofile(f)
+            idx.occurrences.tofile(f)
+            f.write(encoded)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _get_index(file: pathlib.Path, *, persist: bool) -> _Index:
+    stat = file.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    idx = _indexes.get(file)
+    if idx is None or idx.stamp != stamp:
+        idx = _read_sidecar(file, stamp) if persist else None
+        if idx is None:
+            _logger.info(f"Indexing: {file!s}")
+            idx = _Index.build(file, stamp)
+            if persist:
+                try:
+                    _write_sidecar(file, idx)
+                except OSError as e:
+                    # e.g. a read-only checkout, the index is built anyway
+                    _logger.warning(f"Could not store the index of {file!s}: {e}")
+        _indexes[file] = idx
+    return idx
+
+
+def _in_range(version: str, since: str | None, until: str | None) -> bool:
+    if not version:  # unreleased is newer than any release
+        return not until
+    key = version_tools.sort_key(version)
+    return (not since or key >= version_tools.sort_key(since)) and (
+        not until or key <= version_tools.sort_key(until)
+    )
+
+
+def search(
+    query: str,
+    file_paths: Iterable[str] = ("./CHANGELOG.txt",),
+    *,
+    since: str | None = None,
+    until: str | None = None,
+    persist: bool = False,
+) -> list[SearchResult]:
+    """
+    Find the change messages containing every term of a query.
+
+    Terms are matched case-insensitively against the words of each change.
+    A quoted term, or a term made of several words like "CVE-2024-1234", must
+    appear as consecutive words. Indexes are kept in memory and rebuilt when
+    the file modification time or size changes.
+
+    Args:
+        query: The terms to look for, e.g. `requests "security fix"`.
+        file_paths: Paths of the changelog files to search.
+        since: If set, only search versions greater or equal to this one.
+        until: If set, only search versions lower or equal to this one.
+        persist: If True, also store each index next to its changelog file as
+            `CHANGELOG.txt.search`, so later processes can reuse it.
+
+    Returns:
+        The matching changes, by file and in file order.
+
+    Raises:
+        ValueError: If the query has no words or a version is poorly formatted.
+
+    """
+    terms = [t for t in (_tokenize(term) for term in shlex.split(query)) if t]
+    if not terms:
+        raise ValueError(f"Nothing to search in query: {query!r}")
+    for bound in (since, until):
+        if bound:
+            version_tools.sort_key(bound)  # raises if poorly formatted
+
+    results: list[SearchResult] = []
+    for file_path in file_paths:
+        file = _utils.resolve_file_path(file_path)
+        idx = _get_index(file, persist=persist)
+        for i in idx.find(terms):
+            change = idx.changes[i]
+            version = idx.versions[idx.change_versions[i]]
+            if _in_range(version, since, until):
+                results.append(
+                    {"file": str(file), "version": version, "change": change},
+                )
+    return results
@@ -0,0 +1,175 @@
+"""
+Sidecar Index Module.
+
+A changelog `CHANGELOG.txt` may have a `CHANGELOG.txt.idx` next to it, storing
+where each version section starts so one section can be parsed alone.
+
+Layout, little-endian:
+
+    header  magic "CTXI", format (H), reserved (H), file size (Q),
+            blake2b-128 checksum of the file (16s), number of sections (I)
+    records one per section: byte offset (Q), byte length (Q), line number (I),
+            key offset (I) and key length (I) in the key blob
+    keys    the utf-8 encoded version keys, see `version_key`
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import semver
+from packaging import version as pyversion
+
+from changelogtxt_parser import version as version_tools
+
+if TYPE_CHECKING:
+    import pathlib
+
+_MAGIC = b"CTXI"
+_FORMAT = 2
+_HEADER = struct.Struct("<4sHHQ16sI")
+_RECORD = struct.Struct("<QQIII")
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedSection:
+    """
+    Position of one version section in a changelog file.
+
+    Attributes:
+        key: The `version_key` of the section version.
+        offset: Byte offset of the first line of the section.
+        length: Length in bytes of the section.
+        line_no: Line number of the first line of the section.
+
+    """
+
+    key: str
+    offset: int
+    length: int
+    line_no: int
+
+
+def version_key(version: str) -> str:
+    """
+    Return a string equal for two versions if and only if their parses are.
+
+    Args:
+        version: A version as written in the changelog (e.g., "v1.2.3").
+
+    """
+    match version_tools.parse_version(version):
+        case pyversion.Version() as parsed:
+            # the parts `Version.__eq__` compares, trailing zeros removed,
+            # without formatting and parsing it again like canonicalize_version
+            release = list(parsed.release)
+            while len(release) > 1 and release[-1] == 0:
+                release.pop()
+            parts = (parsed.epoch, *release, parsed.pre, parsed.post, parsed.dev)
+            return f"p:{(*parts, parsed.local)!r}"
+        case semver.Version() as parsed:
+            return f"s:{parsed.replace(build=None)}"
+        case version_tools.BadVersion() as parsed:
+            return f"b:{parsed.tag}"
+        case _:
+            return "n:"
+
+
+def sidecar_path(file: pathlib.Path) -> pathlib.Path:
+    """Return the path of the index of a changelog file."""
+    return file.with_name(f"{file.name}.idx")
+
+
+def checksum(data: bytes) -> bytes:
+    """Return the checksum stored in the index for the file content."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def write(file: pathlib.Path, data: bytes, sections: list[IndexedSection]) -> None:
+    """
+    Write the index of a changelog file, replacing any previous one.
+
+    Args:
+        file: Path of the changelog file.
+        data: The content of the changelog file the sections were found in.
+        sections: The sections of the file, in file order.
+
+    """
+    keys = bytearray()
+    records = bytearray()
+    for section in sections:
+        key = section.key.encode("utf-8")
+        records += _RECORD.pack(
+            section.offset,
+            section.length,
+            section.line_no,
+            len(keys),
+            len(key),
+        )
+        keys += key
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT,
+        0,
+        len(data),
+        checksum(data),
+        len(sections),
+    )
+
+    path = sidecar_path(file)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(header + records + keys)
+    tmp.replace(path)
+
+
+def read(file: pathlib.Path, data: bytes) -> list[IndexedSection] | None:
+    """
+    Read the index of a changelog file.
+
+    Args:
+        file: Path of the changelog file.
+        data: The current content of the changelog file.
+
+    Returns:
+        The sections in file order, or `None` if there is no index or it does
+        not match the content anymore.
+
+    """
+    path = sidecar_path(file)
+    try:
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            magic, fmt, _, size, digest, count = _HEADER.unpack_from(m)
+            if (
+                magic != _MAGIC
+                or fmt != _FORMAT
+                or size != len(data)
+                or digest != checksum(data)
+            ):
+                return None
+            blob = _HEADER.size + count * _RECORD.size
+            return [
+                IndexedSection(
+                    key=m[blob + key_offset : blob + key_offset + key_len].decode(),
+                    offset=offset,
+                    length=length,
+                    line_no=line_no,
+                )
+                for offset, length, line_no, key_offset, key_len in _RECORD.iter_unpack(
+                    m[_HEADER.size : blob],
+                )
+            ]
+    except (OSError, ValueError, struct.error):
+        # missing, empty (cannot be mmap'd) or truncated
+        return None
+
+
+def exists(file: pathlib.Path) -> bool:
+    """Return True if the changelog file has an index, stale or not."""
+    return sidecar_path(file).exists()
@@ -0,0 +1,230 @@
+"""JSON Module: stream changelogs to and from JSON or JSON Lines."""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import pathlib
+import shutil
+import sys
+from typing import IO, TYPE_CHECKING
+
+import logistro
+
+from changelogtxt_parser import _utils, serdes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from changelogtxt_parser import version as version_tools
+
+_logger = logistro.getLogger(__name__)
+
+FORMATS = ("json", "jsonl")
+_BLOCK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+
+
+def _check_entry(entry: object, where: str) -> version_tools.VersionEntry:
+    if (
+        not isinstance(entry, dict)
+        or not isinstance(entry.get("version"), str)
+        or not isinstance(entry.get("changes"), list)
+        or not all(isinstance(change, str) for change in entry["changes"])
+    ):
+        raise ValueError(
+            f"Invalid entry {where}: expected an object with a string "
+            '"version" and a list of strings "changes"',
+        )
+    return {"version": entry["version"], "changes": entry["changes"]}
+
+
+@contextlib.contextmanager
+def _open_text(path: str, mode: str) -> Iterator[IO[str]]:
+    if str(path) == "-":
+        yield sys.stdout if mode == "w" else sys.stdin
+        return
+    if mode == "r":
+        with _utils.resolve_file_path(path).open(encoding="utf-8") as f:
+            yield f
+        return
+
+    # like `serdes.dump`, written to a temporary file replacing the output at
+    # the end, so that an error, or reading the output itself, leaves it intact
+    target = pathlib.Path(path).expanduser().resolve()
+    tmp = target.with_name(f".{target.name}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            yield f
+        if target.exists():
+            shutil.copymode(target, tmp)
+        tmp.replace(target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write(
+    entries: Iterable[version_tools.VersionEntry],
+    f: IO[str],
+    *,
+    fmt: str = "json",
+) -> None:
+    """
+    Write version entries to a text stream one at a time.
+
+    JSON Lines have one entry per line. JSON is an array with one entry per
+    line, so it can be streamed too.
+
+    Args:
+        entries: An iterable of `VersionEntry`.
+        f: The stream to write to.
+        fmt: Either "json" or "jsonl".
+
+    Raises:
+        ValueError: If the format is unknown.
+
+    """
+    _check_format(fmt)
+    if fmt == "jsonl":
+        f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        return
+
+    separator = "[\n"
+    for entry in entries:
+        f.write(separator + json.dumps(entry, ensure_ascii=False))
+        separator = ",\n"
+    f.write("[]\n" if separator == "[\n" else "\n]\n")
+
+
+def read(f: IO[str], *, fmt: str = "json") -> Iterator[version_tools.VersionEntry]:
+    """
+    Read version entries from a text stream lazily.
+
+    A JSON array is decoded one element at a time, whatever its layout, so
+    only one entry is held in memory.
+
+    Args:
+        f: The stream to read from.
+        fmt: Either "json" or "jsonl".
+
+    Returns:
+        An iterator of `VersionEntry`.
+
+    Raises:
+        ValueError: If the format is unknown, the input is not valid JSON or an
+            entry is not a version entry.
+
+    """
+    _check_format(fmt)
+    return _read_lines(f) if fmt == "jsonl" else _read_array(f)
+
+
+def _read_lines(f: IO[str]) -> Iterator[version_tools.VersionEntry]:
+    for line_no, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON at line {line_no}: {e.msg}") from e
+        yield _check_entry(item, f"at line {line_no}")
+
+
+def _read_array(f: IO[str]) -> Iterator[version_tools.VersionEntry]:  # noqa: C901
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> None:
+        nonlocal buffer, pos, eof
+        block = f.read(_BLOCK_SIZE)
+        eof = not block
+        buffer = buffer[pos:] + block
+        pos = 0
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            fill()
+
+    if next_char() != "[":
+        raise ValueError("Invalid JSON: expected an array of version entries")
+    pos += 1
+    if next_char() == "]":
+        pos += 1
+    else:
+        for n in itertools.count(1):
+            next_char()
+            while True:
+                try:
+                    item, pos = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    # the element may be cut at the end of the buffer
+                    if eof:
+                        raise
+                    fill()
+            yield _check_entry(item, f"number {n}")
+            char = next_char()
+            pos += 1
+            if char == "]":
+                break
+            if char != ",":
+                raise ValueError(f"Invalid JSON: expected ',' or ']' after entry {n}")
+    if next_char():
+        raise ValueError("Invalid JSON: unexpected data after the array")
+
+
+def export(
+    file_path: str,
+    output_path: str = "-",
+    *,
+    fmt: str = "json",
+) -> None:
+    """
+    Write a changelog as JSON or JSON Lines, streaming it from `serdes.iter_load`.
+
+    Args:
+        file_path: Path of the changelog, or "-" to read the standard input.
+        output_path: Path of the JSON file, or "-" for the standard output.
+        fmt: Either "json" or "jsonl".
+
+    """
+    _check_format(fmt)
+    with _open_text(output_path, "w") as f:
+        write(serdes.iter_load(file_path), f, fmt=fmt)
+    _logger.info(f"Exported {file_path!s} to {output_path!s}")
+
+
+def import_(
+    input_path: str,
+    file_path: str,
+    *,
+    fmt: str = "json",
+    strict: bool = False,
+) -> None:
+    """
+    Write a changelog from JSON or JSON Lines, streaming the entries to `dump`.
+
+    Args:
+        input_path: Path of the JSON file, or "-" to read the standard input.
+        file_path: Path of the changelog to write.
+        fmt: Either "json" or "jsonl".
+        strict: If True, check every version like `serdes.dump` does.
+
+    """
+    _check_format(fmt)
+    with _open_text(input_path, "r") as f:
+        serdes.dump(read(f, fmt=fmt), file_path, strict=strict)
+    _logger.info(f"Imported {input_path!s} to {file_path!s}")
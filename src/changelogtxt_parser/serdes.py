@@ -2,115 +2,661 @@
 
 from __future__ import annotations
 
+import codecs
+import collections
+import contextlib
+import io
+import itertools
+import mmap
+import os
+import pathlib
+import shutil
+import sys
 import textwrap
 import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, TextIO
 
-from changelogtxt_parser import _utils
+import logistro
+
+from changelogtxt_parser import _utils, index
 from changelogtxt_parser import version as version_tools
 
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+_logger = logistro.getLogger(__name__)
+
+_MIN_CHUNK_SIZE = 1024 * 1024
+_BLOCK_SIZE = 1024 * 1024
+# iter_load keeps one block per stream, and aggregate opens many streams
+_STREAM_BLOCK_SIZE = 64 * 1024
+_BOM = "\ufeff"
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """
+    A version entry with the text it was parsed from, see `load_sections`.
+
+    Attributes:
+        entry: The parsed `VersionEntry`, which may be edited in place.
+        version: The version as parsed.
+        header: Text of the version line, with the blank lines before the first
+            change. Only blank lines for unreleased changes.
+        bullets: Each change as parsed, with the text of its lines.
+        trailer: Blank lines at the end of the section.
+
+    """
+
+    entry: version_tools.VersionEntry
+    version: str
+    header: str
+    bullets: tuple[tuple[str, str], ...]
+    trailer: str
+
 
 def load(file_path: str) -> list[version_tools.VersionEntry]:
     """
     Parse a changelog file and returns a list of version entries.
 
     Args:
-        file_path: Path to the file where the changelog will be read.
+        file_path: Path to the file where the changelog will be read, or "-"
+            to read from the standard input.
 
     Returns:
         A list of `VersionEntry` with changelog data
 
     """
-    file = _utils.resolve_file_path(file_path)
+    with _open(file_path) as f:
+        return list(parse_lines(_iter_lines(f, _BLOCK_SIZE)))
 
-    with file.open("r", encoding="utf-8") as f:
-        changelog: list[version_tools.VersionEntry] = []
-        current_entry: version_tools.VersionEntry | None = None
 
-        for line_no, raw in enumerate(f, start=1):
-            line = raw.strip()
-            if not line:
-                continue
+def loads(text: str) -> list[version_tools.VersionEntry]:
+    """
+    Parse a changelog from a string, like `load` does from a file.
 
-            if version_tools.parse_version(line):
-                current_entry = {"version": line, "changes": []}
-                changelog.append(current_entry)
-            elif line.startswith("-"):
-                change = line.lstrip("-").strip()
-                if not change:
-                    raise ValueError(
-                        f"Invalid changelog format at line {line_no}: "
-                        f'Expected content after "-"',
-                    )
+    Args:
+        text: The content of a changelog file.
 
-                if not current_entry:
-                    current_entry = {"version": "", "changes": []}
-                    changelog.append(current_entry)
+    Returns:
+        A list of `VersionEntry` with changelog data
 
-                current_entry["changes"].append(change)
+    """
+    return list(parse_lines(_split_lines(text.removeprefix(_BOM))))
 
-            elif current_entry and current_entry["changes"]:
-                current_entry["changes"][-1] += f" {line}"
 
-            else:
+def parse_lines(  # noqa: C901, PLR0912
+    lines: Iterable[str],
+    *,
+    start: int = 1,
+    headers: list[int] | None = None,
+) -> Iterator[version_tools.VersionEntry]:
+    """
+    Parse changelog lines, yielding each entry once it is complete.
+
+    Args:
+        lines: The lines to parse, with or without line endings.
+        start: Line number of the first line, used in error messages.
+        headers: If given, the line number of every version header is appended.
+
+    Returns:
+        An iterator of `VersionEntry` in file order.
+
+    """
+    current_entry: version_tools.VersionEntry | None = None
+    # lines of the change being parsed, joined once it is complete
+    change: list[str] = []
+
+    for line_no, raw in enumerate(lines, start=start):
+        line = raw.strip()
+        if not line:
+            continue
+
+        # a bullet never parses as a version, so test the cheap case first
+        if line[0] == "-":
+            text = line.lstrip("-").strip()
+            if not text:
                 raise ValueError(
                     f"Invalid changelog format at line {line_no}: "
-                    'Expected "-" and then text content',
+                    f'Expected content after "-"',
                 )
+
+            if change:
+                current_entry["changes"].append(" ".join(change))  # type: ignore[index]
+            elif not current_entry:
+                current_entry = {"version": "", "changes": []}
+            change = [text]
+
+        elif _is_header(line):
+            if change:
+                current_entry["changes"].append(" ".join(change))  # type: ignore[index]
+                change = []
+            if current_entry:
+                yield current_entry
+            if headers is not None:
+                headers.append(line_no)
+            current_entry = {"version": line, "changes": []}
+
+        elif change:
+            change.append(line)
+
+        else:
+            raise ValueError(
+                f"Invalid changelog format at line {line_no}: "
+                'Expected "-" and then text content',
+            )
+
+    if change:
+        current_entry["changes"].append(" ".join(change))  # type: ignore[index]
+    if current_entry:
+        yield current_entry
+
+
+@contextlib.contextmanager
+def _open(file_path: str) -> Iterator[BinaryIO]:
+    if str(file_path) == "-":
+        yield sys.stdin.buffer
+        return
+    with _utils.resolve_file_path(file_path).open("rb") as f:
+        yield f
+
+
+def _split_lines(text: str) -> list[str]:
+    # "\r\n" and lone "\r" end lines too, like in a file opened in text mode
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.split("\n")
+
+
+def _iter_lines(f: BinaryIO, block_size: int) -> Iterator[str]:
+    """Read a binary file in blocks, yielding lines without line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    rest = ""
+    while True:
+        block = f.read(block_size)
+        text = rest + decoder.decode(block, final=not block)
+        # keep a trailing "\r" for the next block, it may start with "\n"
+        cr = "\r" if block and text.endswith("\r") else ""
+        lines = _split_lines(text[: len(text) - len(cr)])
+        rest = lines.pop() + cr
+        yield from lines
+        if not block:
+            if rest:
+                yield rest
+            return
+
+
+def iter_load(
+    file_path: str,
+    *,
+    block_size: int = _STREAM_BLOCK_SIZE,
+) -> Generator[version_tools.VersionEntry, None, None]:
+    """
+    Parse a changelog file lazily, yielding one version entry at a time.
+
+    Only the entry being parsed is kept in memory, which makes it suitable for
+    streaming many or large files, see `aggregate`.
+
+    Args:
+        file_path: Path to the file where the changelog will be read, or "-"
+            to read from the standard input.
+        block_size: Number of bytes read at a time. Defaults to 64 KiB.
+
+    Returns:
+        A generator of `VersionEntry` in file order, closing it closes the file.
+
+    """
+    with _open(file_path) as f:
+        yield from parse_lines(_iter_lines(f, block_size))
+
+
+def load_sections(file_path: str) -> list[Section]:
+    """
+    Parse a changelog file, keeping the original text of every section.
+
+    Passing the sections to `dump` writes unchanged headers and changes back
+    byte for byte, line endings included, and only formats the new ones.
+
+    Args:
+        file_path: Path to the file where the changelog will be read, or "-"
+            to read from the standard input.
+
+    Returns:
+        A list of `Section`, one per version entry.
+
+    """
+    with _open(file_path) as f:
+        text = f.read().decode("utf-8-sig")
+    # newline="" splits lines like a file opened in text mode, keeping endings
+    lines = list(io.StringIO(text, newline=""))
+    headers: list[int] = []
+    entries = list(parse_lines(lines, headers=headers))
+    spans = _split_spans(lines, set(headers))
+    return [
+        Section(
+            entry=entry,
+            version=entry["version"],
+            header="".join(header),
+            bullets=tuple(
+                zip(entry["changes"], map("".join, bullets), strict=True),
+            ),
+            trailer=trailer,
+        )
+        for entry, ((header, *bullets), trailer) in zip(entries, spans, strict=True)
+    ]
+
+
+def _split_spans(
+    lines: list[str],
+    headers: set[int],
+) -> list[tuple[list[list[str]], str]]:
+    """Group valid changelog lines by section: header, one per change, trailer."""
+    spans: list[tuple[list[list[str]], str]] = []
+    current: list[list[str]] = []
+    blank: list[str] = []
+    for line_no, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if not stripped:
+            blank.append(line)
+            continue
+        if line_no in headers:
+            if current:
+                spans.append((current, "".join(blank)))
+                current, blank = [], []
+            current.append([*blank, line])
+        elif stripped[0] == "-":
+            if not current:
+                current.append([])  # unreleased changes have no header
+            current[-1].extend(blank)
+            current.append([line])
+        else:
+            current[-1].extend([*blank, line])
+        blank = []
+    if current:
+        spans.append((current, "".join(blank)))
+    return spans
+
+
+def load_parallel(
+    file_path: str,
+    *,
+    workers: int | None = None,
+    min_chunk_size: int = _MIN_CHUNK_SIZE,
+) -> list[version_tools.VersionEntry]:
+    """
+    Parse a large changelog file using a pool of processes.
+
+    The file is split at version header lines, so every chunk but the first
+    starts with a header, and the chunks are parsed in parallel. The result and
+    the errors raised are the same as with `load`. Files smaller than two
+    chunks are parsed sequentially.
+
+    Args:
+        file_path: Path to the file where the changelog will be read.
+        workers: Number of processes, defaults to the number of CPUs.
+        min_chunk_size: Minimum size in bytes of a chunk.
+
+    Returns:
+        A list of `VersionEntry` with changelog data
+
+    """
+    file = _utils.resolve_file_path(file_path)
+    workers = workers or os.cpu_count() or 1
+    size = file.stat().st_size
+    if workers < 2 or size < 2 * min_chunk_size:  # noqa: PLR2004
+        return load(str(file))
+
+    with file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        n_chunks = min(workers * 4, size // min_chunk_size)
+        bounds = _split_at_headers(m, [size * i // n_chunks for i in range(n_chunks)])
+    if len(bounds) == 1:
+        return load(str(file))
+
+    chunks = list(zip(bounds, [*bounds[1:], size], strict=True))
+    changelog: list[version_tools.VersionEntry] = []
+    line_no = 1
+    # imported here: process pools are slow to import and only large files use one
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    failed: tuple[int, int, ValueError] | None = None
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_load_chunk, str(file), start, end) for start, end in chunks
+        ]
+        for (start, end), future in zip(chunks, futures, strict=True):
+            try:
+                entries, n_lines = future.result()
+            except ValueError as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                failed = (start, end, e)
+                break
+            changelog.extend(entries)
+            line_no += n_lines
+
+    if failed:
+        # The worker counted lines from the chunk start, parse it again to raise
+        # with the line number in the whole file, outside of the except block so
+        # that the error of the worker is not chained to it.
+        start, end, error = failed
+        list(_parse_chunk(_read_chunk(str(file), start, end), line_no))
+        raise error
     return changelog
 
 
+def load_section(file_path: str, tag: str) -> version_tools.VersionEntry | None:
+    """
+    Parse only the section of one version, using the sidecar index if any.
+
+    An index that no longer matches the file content is rebuilt from the whole
+    file, and written back if the directory can be written to. Only the returned
+    section is validated when an up-to-date index is used. Without an index the
+    whole file is parsed.
+
+    Args:
+        file_path: Path to the file where the changelog will be read.
+        tag: The version tag to look up (e.g., "1.2.3" or "v1.2.3").
+
+    Returns:
+        The `VersionEntry` of the first section with an equal version, or `None`.
+
+    """
+    file = _utils.resolve_file_path(file_path)
+    key = index.version_key(tag)
+
+    if not index.exists(file):
+        for entry in load(str(file)):
+            if index.version_key(entry["version"]) == key:
+                return entry
+        return None
+
+    data = file.read_bytes()
+    sections = index.read(file, data)
+    if sections is None:
+        _logger.info(f"Rebuilding stale index of: {file!s}")
+        sections = _find_sections(data)
+        try:
+            index.write(file, data, sections)
+        except OSError as e:
+            # e.g. a read-only directory, the lookup does not need the file
+            _logger.warning(f"Could not rebuild the index of {file!s}: {e}")
+
+    for section in sections:
+        if section.key == key:
+            chunk = data[section.offset : section.offset + section.length]
+            return next(_parse_chunk(chunk, section.line_no))
+    return None
+
+
+def build_index(file_path: str) -> pathlib.Path:
+    """
+    Write the sidecar index of a changelog file, see the `index` module.
+
+    Once it exists, `dump` keeps it up to date and `load_section` uses it.
+
+    Args:
+        file_path: Path to the changelog file to index.
+
+    Returns:
+        The path of the index file.
+
+    """
+    file = _utils.resolve_file_path(file_path)
+    data = file.read_bytes()
+    index.write(file, data, _find_sections(data))
+    return index.sidecar_path(file)
+
+
+def _find_sections(data: bytes) -> list[index.IndexedSection]:
+    # headers are found the way `load` finds them, then located in the bytes
+    headers: list[int] = []
+    lines = _split_lines(data.decode("utf-8-sig"))
+    versions = [entry["version"] for entry in parse_lines(lines, headers=headers)]
+    if not versions:
+        return []
+
+    # bytes.splitlines only ends lines at "\n", "\r" and "\r\n", like _split_lines
+    line_starts = list(
+        itertools.accumulate(map(len, data.splitlines(keepends=True)), initial=0),
+    )
+    released = versions[len(versions) - len(headers) :]
+    starts = [
+        (index.version_key(version), line_starts[line_no - 1], line_no)
+        for version, line_no in zip(released, headers, strict=True)
+    ]
+    if len(released) < len(versions):
+        # unreleased changes come before the first header
+        starts.insert(0, (index.version_key(""), 0, 1))
+
+    ends = [offset for _, offset, _ in starts[1:]] + [len(data)]
+    return [
+        index.IndexedSection(key=key, offset=start, length=end - start, line_no=line_no)
+        for (key, start, line_no), end in zip(starts, ends, strict=True)
+    ]
+
+
+def _split_at_headers(m: mmap.mmap, targets: list[int]) -> list[int]:
+    """Return the offsets of the first header line at or after each target."""
+    bounds = [0]
+    for target in targets[1:]:
+        pos = m.find(b"\n", max(target, bounds[-1]))
+        if pos == -1:
+            break
+        m.seek(pos + 1)
+        while line := m.readline():
+            if _is_header_line(line):
+                bounds.append(m.tell() - len(line))
+                break
+        else:
+            break
+    return bounds
+
+
+def _is_header_line(raw: bytes) -> bool:
+    line = raw.rstrip(b"\n").removesuffix(b"\r")
+    if b"\r" in line:  # a lone "\r" ends a line too, do not split there
+        return False
+    try:
+        return _is_header(line.decode("utf-8").strip())
+    except UnicodeDecodeError:
+        return False
+
+
+def _is_header(line: str) -> bool:
+    """Return whether a stripped line is a version header."""
+    # anything `version.parse_version` accepts starts with "v" or a decimal digit,
+    # Unicode ones included, so only those lines are parsed
+    first = line[:1]
+    return (first in {"v", "V"} or first.isdecimal()) and bool(
+        version_tools.parse_version(line),
+    )
+
+
+def _read_chunk(file_path: str, start: int, end: int) -> bytes:
+    with pathlib.Path(file_path).open("rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _parse_chunk(data: bytes, start: int) -> Iterator[version_tools.VersionEntry]:
+    return parse_lines(_split_lines(data.decode("utf-8-sig")), start=start)
+
+
+def _load_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+) -> tuple[list[version_tools.VersionEntry], int]:
+    data = _read_chunk(file_path, start, end)
+    n_lines = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    return list(_parse_chunk(data, 1)), n_lines
+
+
 def dump(
-    entries: list[version_tools.VersionEntry],
+    entries: Iterable[version_tools.VersionEntry],
     file_path: str,
     *,
     strict: bool = False,
+    sections: Iterable[Section] | None = None,
 ) -> None:
     """
     Write a formatted changelog to the specified file path.
 
     Each entry in the changelog includes a version string and a list of changes.
+    Entries are written one at a time to a temporary file that replaces the
+    changelog at the end, so they can be streamed, even from `iter_load` of the
+    same file, and the changelog is left untouched if an error is raised.
 
     Args:
-        entries: A list of `VersionEntry` objects, each containing a version
+        entries: An iterable of `VersionEntry` objects, each containing a version
             string and associated changes.
         file_path: Path to the file where the changelog will be written.
         strict: If True, attempts to parse the version string for each entry.
             Defaults to False.
+        sections: The sections from `load_sections` the entries were edited
+            from. Headers and changes whose text did not change are written as
+            they were read instead of being wrapped again.
 
     """
     file = _utils.resolve_file_path(file_path, touch=True)
+    # replace the file a symlink points to, not the symlink
+    target = file.resolve()
+    tmp = target.with_name(f".{target.name}.tmp")
+
+    try:
+        # newline="" keeps the line endings of the original sections
+        newline = None if sections is None else ""
+        with tmp.open("w", encoding="utf-8", newline=newline) as f:
+            if sections is not None:
+                _write_sections(f, entries, list(sections), strict=strict)
+            else:
+                _write_entries(f, entries, strict=strict)
+        shutil.copymode(target, tmp)
+        tmp.replace(target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    if index.exists(file):
+        build_index(str(file))
+
+
+def _write_entries(
+    f: TextIO,
+    entries: Iterable[version_tools.VersionEntry],
+    *,
+    strict: bool,
+) -> None:
+    # writes "\n\n".join(sections).strip() one section at a time, holding back
+    # whitespace until text follows it (None until the first text is written)
+    pending: str | None = None
+    for entry in entries:
+        section = _format_section(entry, strict=strict)
+        text = section.lstrip() if pending is None else f"{pending}\n\n{section}"
+        content = text.rstrip()
+        if content:
+            f.write(content)
+            pending = text[len(content) :]
+        elif pending is not None:
+            pending = text
+
+
+def _write_sections(  # noqa: C901
+    f: TextIO,
+    entries: Iterable[version_tools.VersionEntry],
+    sections: list[Section],
+    *,
+    strict: bool,
+) -> None:
+    # original texts by what they parsed to, taken in file order
+    headers: dict[str, collections.deque[Section]] = {}
+    bullets: dict[str, collections.deque[str]] = {}
+    for section in sections:
+        headers.setdefault(section.version, collections.deque()).append(section)
+        for change, text in section.bullets:
+            bullets.setdefault(change, collections.deque()).append(text)
+    newline = _newline(sections)
+    last = sections[-1] if sections else None
+    written = ""
+
+    def write(text: str) -> None:
+        # formatted texts have no line ending, add it once more text follows
+        nonlocal written
+        if text:
+            if written and not written.endswith(("\n", "\r")):
+                f.write(newline)
+            f.write(text)
+            written = text
 
-    changelog = []
+    previous: Section | None = None
     for entry in entries:
-        version = entry["version"]
-        changes = entry["changes"]
-
-        if strict:
-            parsed = version_tools.parse_version(version)
-            if not parsed:
-                raise ValueError(f"Invalid version format: {version!s}")
-            elif isinstance(parsed, version_tools.BadVersion):
-                warnings.warn(
-                    f"Bad version detected: {version!s}.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-            section = [f"v{version!s}"]
-        else:
-            section = [version] if version else []
-
-        for change in changes:
-            wrapped = textwrap.fill(
-                change,
-                width=88,
-                initial_indent="- ",
-                subsequent_indent="  ",
-            )
-            section.append(wrapped)
+        version = _format_version(entry["version"], strict=strict)
+        original = headers.get(version)
+        if not original and not version and not entry["changes"]:
+            continue
+        if written:
+            # the last section has no blank line to separate it from the next
+            write(previous.trailer if previous and previous is not last else newline)
+
+        previous = original.popleft() if original else None
+        write(previous.header if previous else version)
+        for change in entry["changes"]:
+            texts = bullets.get(change)
+            write(texts.popleft() if texts else _format_change(change, newline))
+
+    if not last:
+        return
+    if previous is last:
+        write(last.trailer)
+    end = last.trailer or (last.bullets[-1][1] if last.bullets else last.header)
+    if end.endswith(("\n", "\r")) and not written.endswith(("\n", "\r")):
+        f.write(newline)
+
+
+def _newline(sections: list[Section]) -> str:
+    """Return the line ending used by the sections, LF by default."""
+    for section in sections:
+        for text in (section.header, *(text for _, text in section.bullets)):
+            if ending := _line_ending(text):
+                return ending
+    return "\n"
+
+
+def _line_ending(text: str) -> str:
+    """Return the line ending of the first line of text, if any."""
+    ends = [i for i in (text.find("\r"), text.find("\n")) if i >= 0]
+    if not ends:
+        return ""
+    i = min(ends)
+    return "\r\n" if text.startswith("\r\n", i) else text[i]
+
+
+def _format_section(entry: version_tools.VersionEntry, *, strict: bool) -> str:
+    version = _format_version(entry["version"], strict=strict)
+    section = [version] if version else []
+    section.extend(_format_change(change, "\n") for change in entry["changes"])
+    return "\n".join(section)
+
 
-        changelog.append("\n".join(section))
+def _format_version(version: str, *, strict: bool) -> str:
+    if not strict:
+        return version
+    parsed = version_tools.parse_version(version)
+    if not parsed:
+        raise ValueError(f"Invalid version format: {version!s}")
+    elif isinstance(parsed, version_tools.BadVersion):
+        warnings.warn(
+            f"Bad version detected: {version!s}.",
+            UserWarning,
+            stacklevel=5,
+        )
+    return f"v{version!s}"
 
-    content: str = "\n\n".join(changelog) + "\n"
 
-    with file.open("w", encoding="utf-8") as f:
-        f.write(content.strip())
+def _format_change(change: str, newline: str) -> str:
+    wrapped = textwrap.wrap(
+        change,
+        width=88,
+        initial_indent="- ",
+        subsequent_indent="  ",
+    )
+    return newline.join(wrapped)
@@ -0,0 +1,183 @@
+"""Resident Server Module."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, NamedTuple
+
+import logistro
+
+from changelogtxt_parser import _utils, app, client, index, serdes
+from changelogtxt_parser import version as version_tools
+
+_logger = logistro.getLogger(__name__)
+
+_POLL_INTERVAL = 0.2
+
+
+def _error(e: Exception) -> dict[str, Any]:
+    return {"ok": False, "error": {"type": type(e).__name__, "message": str(e)}}
+
+
+class _Cached(NamedTuple):
+    stamp: tuple[int, int]
+    entries: list[version_tools.VersionEntry]
+    # `index.version_key` of each version to its first entry
+    by_key: dict[str, version_tools.VersionEntry]
+
+
+class _Cache:
+    """Parsed changelogs, revalidated by modification time and size."""
+
+    def __init__(self) -> None:
+        self._entries: dict[pathlib.Path, _Cached] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, file_path: str) -> _Cached:
+        file = _utils.resolve_file_path(file_path)
+        stat = file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(file)
+        if cached and cached.stamp == stamp:
+            return cached
+
+        entries = serdes.load(str(file))
+        by_key: dict[str, version_tools.VersionEntry] = {}
+        for entry in entries:
+            by_key.setdefault(index.version_key(entry["version"]), entry)
+        cached = _Cached(stamp, entries, by_key)
+        with self._lock:
+            self._entries[file] = cached
+        return cached
+
+    def load(self, file_path: str) -> list[version_tools.VersionEntry]:
+        return self._get(file_path).entries
+
+    def find_tag(self, tag: str, file_path: str) -> version_tools.VersionEntry:
+        """Return the entry of a tag like `app.get_tag`, from the cached entries."""
+        entry = self._get(file_path).by_key.get(index.version_key(tag))
+        if entry is None:
+            raise ValueError(f"Tag '{tag}' not found in changelog.")
+        return entry
+
+    def discard(self, file_path: str) -> None:
+        file = _utils.resolve_file_path(file_path)
+        with self._lock:
+            self._entries.pop(file, None)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            if self.server.stopped:
+                return
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str) -> None:
+        super().__init__(socket_path, _Handler)
+        self.timeout = _POLL_INTERVAL
+        self.stopped = False
+        self.last_activity = time.monotonic()
+        self._cache = _Cache()
+        self._write_lock = threading.Lock()
+
+    def dispatch(self, line: bytes) -> dict[str, Any]:
+        self.last_activity = time.monotonic()
+        try:
+            params = json.loads(line)
+            result = self._run(params.pop("command", None), params)
+        except KeyError as e:
+            return _error(ValueError(f"Missing parameter: {e}"))
+        # a bad parameter type or a file system error must not kill the thread
+        except (AttributeError, OSError, RuntimeError, TypeError, ValueError) as e:
+            return _error(e)
+        return {"ok": True, "result": result}
+
+    def _run(self, command: str | None, params: dict[str, Any]) -> Any:
+        match command:
+            case "ping":
+                return "pong"
+            case "get-tag":
+                return self._cache.find_tag(params["tag"], params["file"])
+            case "check-format":
+                self._cache.load(params["file"])
+                return None
+            case "summarize-news":
+                new_versions, new_changes = app.compare_entries(
+                    self._cache.load(params["source"]),
+                    self._cache.load(params["target"]),
+                )
+                return [
+                    sorted(new_versions),
+                    {v: sorted(c) for v, c in new_changes.items()},
+                ]
+            case "update":
+                with self._write_lock:
+                    app.update(
+                        params.get("tag") or "",
+                        params.get("message") or "",
+                        params["file"],
+                        force=params.get("force", False),
+                        strict=params.get("strict", False),
+                    )
+                    self._cache.discard(params["file"])
+                return None
+            case "shutdown":
+                self.stopped = True
+                return None
+            case _:
+                raise ValueError(f"Unknown command: {command}")
+
+
+def serve(
+    socket_path: str = client.DEFAULT_SOCKET,
+    *,
+    idle_timeout: float | None = None,
+) -> None:
+    """
+    Answer changelog requests over a Unix domain socket until stopped.
+
+    Parsed changelogs are kept in memory and reparsed only when their
+    modification time or size changes. Each connection is handled in its own
+    thread, see `client.request` for the protocol.
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on.
+        idle_timeout: If set, stop after this many seconds without requests.
+
+    Raises:
+        RuntimeError: If another server is already listening on the socket.
+
+    """
+    path = pathlib.Path(socket_path)
+    if path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(socket_path) == 0:
+                raise RuntimeError(f"A server is already listening on {socket_path}")
+        path.unlink()
+
+    with _Server(socket_path) as server:
+        _logger.info(f"Listening on: {socket_path}")
+        try:
+            while not server.stopped:
+                server.handle_request()
+                idle = time.monotonic() - server.last_activity
+                if idle_timeout is not None and idle > idle_timeout:
+                    _logger.info("Idle timeout reached, shutting down.")
+                    break
+        finally:
+            path.unlink(missing_ok=True)
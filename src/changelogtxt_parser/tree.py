@@ -0,0 +1,210 @@
+"""Tree Module: summarize news of every changelog in a tree."""
+
+from __future__ import annotations
+
+import filecmp
+import os
+import pathlib
+import subprocess
+from typing import TYPE_CHECKING, Any
+
+import logistro
+
+from changelogtxt_parser import app, serdes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from changelogtxt_parser import version as version_tools
+
+_logger = logistro.getLogger(__name__)
+
+News = tuple[set[str], dict[str, set[str]]]
+
+
+def _find_changelogs(root: pathlib.Path, name: str) -> dict[str, pathlib.Path]:
+    found = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        if name in filenames:
+            path = pathlib.Path(dirpath) / name
+            found[path.relative_to(root).as_posix()] = path
+    return found
+
+
+def _load_file(path: pathlib.Path | None) -> list[version_tools.VersionEntry]:
+    return serdes.load(str(path)) if path else []
+
+
+def _load_text(text: str | None) -> list[version_tools.VersionEntry]:
+    return serdes.loads(text) if text else []
+
+
+def _compare_files(pair: tuple[pathlib.Path | None, pathlib.Path | None]) -> News:
+    return app.compare_entries(_load_file(pair[0]), _load_file(pair[1]))
+
+
+def _compare_texts(pair: tuple[str | None, str | None]) -> News:
+    return app.compare_entries(_load_text(pair[0]), _load_text(pair[1]))
+
+
+def _report(
+    paths: list[str],
+    compare: Callable[[Any], News],
+    pairs: list[Any],
+    workers: int | None,
+) -> dict[str, News]:
+    if len(pairs) < 2 or workers == 1:  # noqa: PLR2004
+        return _collect(paths, map(compare, pairs))
+
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _collect(paths, executor.map(compare, pairs))
+
+
+def _collect(paths: list[str], news: Iterator[News]) -> dict[str, News]:
+    report = {}
+    for path in paths:
+        try:
+            diff = next(news)
+        except ValueError as e:
+            # say which of the many changelogs is invalid
+            raise ValueError(f"{path}: {e}") from e
+        if any(diff):
+            report[path] = diff
+    return report
+
+
+def summarize_dirs(
+    source_root: str,
+    target_root: str,
+    *,
+    name: str = "CHANGELOG.txt",
+    workers: int | None = None,
+) -> dict[str, News]:
+    """
+    Summarize news of every changelog file between two directory trees.
+
+    Changelogs are paired by their path relative to each root. Pairs with the
+    same content are skipped without parsing, the others are compared like
+    `app.summarize_news` in a pool of processes. A changelog missing on one
+    side is compared with an empty one. Hidden directories are not searched.
+
+    Args:
+        source_root: Directory with the original changelog files.
+        target_root: Directory with the updated changelog files.
+        name: File name of the changelogs to look for.
+        workers: Number of processes, defaults to the number of CPUs.
+
+    Returns:
+        For each changelog path (relative to the roots) with differences, the
+        new versions and new changes, as returned by `app.summarize_news`.
+
+    Raises:
+        FileNotFoundError: If a root is not a directory.
+        ValueError: If a changelog is invalid, prefixed with its path.
+
+    """
+    roots = [pathlib.Path(source_root), pathlib.Path(target_root)]
+    for root in roots:
+        if not root.is_dir():
+            raise FileNotFoundError(f"Directory not found: {root!s}")
+    source, target = (_find_changelogs(root, name) for root in roots)
+
+    changed = []
+    for path in sorted(source.keys() | target.keys()):
+        src, trg = source.get(path), target.get(path)
+        if src and trg and filecmp.cmp(src, trg, shallow=False):
+            continue
+        changed.append(path)
+    _logger.info(f"{len(changed)} changed changelog files")
+
+    pairs = [(source.get(path), target.get(path)) for path in changed]
+    return _report(changed, _compare_files, pairs, workers)
+
+
+def _git(repo: str, *args: str, stdin: bytes | None = None) -> bytes:
+    try:
+        return subprocess.run(  # noqa: S603
+            ["git", "-C", repo, *args],  # noqa: S607
+            input=stdin,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git {args[0]} failed: {e.stderr.decode().strip()}") from e
+
+
+def _read_blobs(repo: str, shas: list[str]) -> dict[str, str]:
+    if not shas:
+        return {}
+    out = _git(repo, "cat-file", "--batch", stdin="\n".join(shas).encode() + b"\n")
+    blobs = {}
+    pos = 0
+    for sha in shas:
+        header_end = out.index(b"\n", pos)
+        size = int(out[pos:header_end].split()[2])
+        pos = header_end + 1
+        blobs[sha] = out[pos : pos + size].decode("utf-8")
+        pos += size + 1
+    return blobs
+
+
+def summarize_revisions(
+    base: str,
+    head: str,
+    *,
+    repo: str = ".",
+    name: str = "CHANGELOG.txt",
+    workers: int | None = None,
+) -> dict[str, News]:
+    """
+    Summarize news of every changelog file between two git revisions.
+
+    `git diff` lists the changelogs whose blobs differ, so unchanged ones are
+    never read. The blobs are read with one `git cat-file --batch` call and
+    compared like `app.summarize_news` in a pool of processes.
+
+    Args:
+        base: The original revision (branch, tag or commit).
+        head: The updated revision to compare against.
+        repo: Path of the git repository.
+        name: File name of the changelogs to look for.
+        workers: Number of processes, defaults to the number of CPUs.
+
+    Returns:
+        For each changelog path (relative to the repository root) with
+        differences, the new versions and new changes.
+
+    Raises:
+        RuntimeError: If a git command fails.
+        ValueError: If a changelog is invalid, prefixed with its path.
+
+    """
+    out = _git(
+        repo,
+        "diff",
+        "--raw",
+        "-z",
+        "--no-renames",
+        "--no-abbrev",
+        base,
+        head,
+        "--",
+        f":(glob)**/{name}",
+    )
+    fields = out.decode("utf-8").split("\0")
+    changed: list[tuple[str, str, str]] = []
+    for meta, path in zip(fields[0:-1:2], fields[1::2], strict=True):
+        _, _, src_sha, trg_sha, _ = meta.split(" ")
+        changed.append((path, src_sha, trg_sha))
+    _logger.info(f"{len(changed)} changed changelog files")
+
+    blobs = _read_blobs(
+        repo,
+        # an all-zero id stands for a missing file
+        sorted({sha for _, *shas in changed for sha in shas if sha.strip("0")}),
+    )
+    pairs = [(blobs.get(src), blobs.get(trg)) for _, src, trg in changed]
+    return _report([path for path, _, _ in changed], _compare_texts, pairs, workers)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import re
 from dataclasses import dataclass
 from typing import TypedDict
@@ -116,3 +118,109 @@ def parse_version(version: str) -> _VersionTypes:
     except ValueError:
         pass
     return None
+
+
+# Ranks of a pre-release phase in a sort key, a release without one is final.
+_DEV_ONLY = -1
+_PRE_RANKS = {"a": 1, "alpha": 1, "b": 2, "beta": 2, "c": 3, "rc": 3, "pre": 3}
+# Semver pre-releases compare their identifiers in ASCII order, so they are
+# ranked by the interval their first identifier falls in: "alpha.b" ranks like
+# an alpha, "x" like a release candidate, "1" or "Alpha" (before "alpha") lower
+# than both, and the identifiers break ties.
+_SEMVER_RANK_BOUNDS = ("alpha", "beta", "rc")
+_FINAL = 9
+_SEGMENT_RE = re.compile(r"[.\-_]")
+
+_Segment = tuple[int, int, str]
+_Pre = tuple[int, int, tuple[_Segment, ...]]
+SortKey = tuple[
+    int,
+    tuple[int, ...],
+    _Pre,
+    tuple[int, int],
+    tuple[int, int],
+    tuple[_Segment, ...],
+]
+
+
+def _segments(text: str | None) -> tuple[_Segment, ...]:
+    # PEP 440 local versions rank numeric segments after alphanumeric ones
+    if not text:
+        return ()
+    return tuple(
+        (1, int(part), "") if part.isdecimal() else (0, 0, part)
+        for part in _SEGMENT_RE.split(text)
+    )
+
+
+def _semver_segments(prerelease: str) -> tuple[_Segment, ...]:
+    # numeric identifiers have lower precedence than alphanumeric ones
+    return tuple(
+        (0, int(part), "") if part.isdecimal() else (1, 0, part)
+        for part in prerelease.split(".")
+    )
+
+
+def _release(*numbers: int) -> tuple[int, ...]:
+    release = list(numbers)
+    while release and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
+# bounded: merging streams of changelogs would otherwise keep every key
+@functools.lru_cache(maxsize=4096)
+def sort_key(version: str) -> SortKey:
+    """
+    Return a key ordering versions, whichever library parsed them.
+
+    `parse_version` can return versions of different types that cannot be
+    compared with each other. Their keys can: the release numbers come first
+    (trailing zeros ignored), then the pre-release, post-release, dev-release
+    and local parts, following PEP 440. Semver pre-releases of the same release
+    follow semver precedence, and build metadata is ignored.
+
+    Args:
+        version: A version as written in the changelog (e.g., "v1.2.3").
+
+    Raises:
+        ValueError: If the version cannot be parsed.
+
+    """
+    final: _Pre = (_FINAL, 0, ())
+    pre: _Pre
+    match parse_version(version):
+        case pyversion.Version() as v:
+            if v.pre:
+                pre = (_PRE_RANKS[v.pre[0]], v.pre[1], ())
+            elif v.dev is not None and v.post is None:
+                pre = (_DEV_ONLY, 0, ())
+            else:
+                pre = final
+            return (
+                v.epoch,
+                _release(*v.release),
+                pre,
+                (0, 0) if v.post is None else (1, v.post),
+                (1, 0) if v.dev is None else (0, v.dev),
+                _segments(v.local),
+            )
+        case semver.Version() as v:
+            if v.prerelease:
+                first = v.prerelease.split(".", 1)[0]
+                rank = bisect.bisect_right(_SEMVER_RANK_BOUNDS, first)
+                pre = (rank, 0, _semver_segments(v.prerelease))
+            else:
+                pre = final
+            return (0, _release(v.major, v.minor, v.patch), pre, (0, 0), (1, 0), ())
+        case BadVersion() as v:
+            return (
+                0,
+                _release(v.major, v.minor, v.micro),
+                final,
+                (0, 0),
+                (1, 0),
+                _segments(v.local),
+            )
+        case _:
+            raise ValueError(f"Poorly formatted version value {version}")
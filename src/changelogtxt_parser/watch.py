@@ -0,0 +1,208 @@
+"""Watch Module: re-validate changelogs incrementally when they change."""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import logistro
+
+from changelogtxt_parser import _utils, serdes
+from changelogtxt_parser import version as version_tools
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterable
+
+_logger = logistro.getLogger(__name__)
+
+_BLOCK = 4096
+
+
+@dataclass(slots=True)
+class _State:
+    """What is known about a file after its last parse."""
+
+    stamp: tuple[int, int]
+    data: bytes
+    entries: list[version_tools.VersionEntry] = field(default_factory=list)
+    # For every version header parsed so far: its line number, the byte offset
+    # where the line starts and where its line ending stops (inf if it has none).
+    lines: list[int] = field(default_factory=list)
+    starts: list[int] = field(default_factory=list)
+    ends: list[float] = field(default_factory=list)
+    # the message of the error the parse stopped at, if any
+    error: str | None = None
+
+
+def _first_difference(old: bytes, new: bytes) -> int:
+    n = min(len(old), len(new))
+    for pos in range(0, n, _BLOCK):
+        if old[pos : pos + _BLOCK] != new[pos : pos + _BLOCK]:
+            for i in range(pos, min(pos + _BLOCK, n)):
+                if old[i] != new[i]:
+                    return i
+    return n
+
+
+class Watcher:
+    """
+    Keep the last parse of each file and re-validate it incrementally.
+
+    On change, the first modified byte is located and parsing restarts at the
+    version section enclosing it. Sections before that are reused as they are.
+    """
+
+    def __init__(self, file_paths: Iterable[str]) -> None:
+        """
+        Create a watcher for one or many changelog files.
+
+        Args:
+            file_paths: Paths of the changelog files to watch.
+
+        """
+        self._paths = [_utils.resolve_file_path(p) for p in file_paths]
+        self._states: dict[pathlib.Path, _State] = {}
+
+    @property
+    def paths(self) -> list[pathlib.Path]:
+        """Return the resolved paths of the watched files."""
+        return list(self._paths)
+
+    def check(self, file_path: str | pathlib.Path) -> list[version_tools.VersionEntry]:
+        """
+        Validate a watched file, reusing whatever is unchanged since last time.
+
+        A file whose content did not change is not parsed again, its last
+        entries are returned or its last error is raised.
+
+        Args:
+            file_path: Path of a watched changelog file.
+
+        Returns:
+            A list of `VersionEntry`, the same as `serdes.load` would return.
+
+        Raises:
+            ValueError: If the changelog has an invalid format.
+
+        """
+        file = _utils.resolve_file_path(str(file_path))
+        stat = file.stat()
+        data = file.read_bytes()
+        state = self._states.get(file)
+        if state and state.data == data:
+            # unchanged content, e.g. only touched: the last result holds
+            state.stamp = (stat.st_mtime_ns, stat.st_size)
+            if state.error:
+                raise ValueError(state.error)
+            return list(state.entries)
+
+        offset = 0
+        h = -1
+        if state:
+            h = bisect.bisect_right(state.ends, _first_difference(state.data, data)) - 1
+        if state and h >= 0:
+            leading = int(bool(state.entries) and state.entries[0]["version"] == "")
+            offset = state.starts[h]
+            new = _State(
+                stamp=(stat.st_mtime_ns, stat.st_size),
+                data=data,
+                entries=state.entries[: h + leading],
+                lines=state.lines[:h],
+                starts=state.starts[:h],
+                ends=state.ends[:h],
+            )
+            start = state.lines[h]
+        else:
+            new = _State(stamp=(stat.st_mtime_ns, stat.st_size), data=data)
+            start = 1
+        self._states[file] = new
+        _logger.debug(f"Reparsing {file!s} from byte {offset}, line {start}")
+
+        raw_lines = data[offset:].splitlines(keepends=True)
+        line_starts = list(itertools.accumulate(map(len, raw_lines), initial=offset))
+        headers: list[int] = []
+        try:
+            for entry in serdes.parse_lines(
+                (
+                    raw.decode("utf-8-sig" if i == 0 == offset else "utf-8")
+                    for i, raw in enumerate(raw_lines)
+                ),
+                start=start,
+                headers=headers,
+            ):
+                new.entries.append(entry)
+        except ValueError as e:
+            new.error = str(e)
+            raise
+        finally:
+            for line_no in headers:
+                i = line_no - start
+                new.lines.append(line_no)
+                new.starts.append(line_starts[i])
+                terminated = raw_lines[i].endswith((b"\n", b"\r"))
+                new.ends.append(line_starts[i + 1] if terminated else math.inf)
+        return list(new.entries)
+
+    def poll(self) -> list[tuple[pathlib.Path, str | None]]:
+        """
+        Re-validate the watched files whose modification time or size changed.
+
+        Returns:
+            For each changed file, its path and the error message, or `None` if
+            its format is valid.
+
+        """
+        results: list[tuple[pathlib.Path, str | None]] = []
+        for file in self._paths:
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                if self._states.pop(file, None) is not None:
+                    results.append((file, f"File not found: {file!s}"))
+                continue
+            state = self._states.get(file)
+            if state and state.stamp == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                self.check(file)
+            except (FileNotFoundError, ValueError) as e:
+                results.append((file, str(e)))
+            else:
+                results.append((file, None))
+        return results
+
+
+def watch(
+    file_paths: Iterable[str],
+    *,
+    interval: float = 0.5,
+    callback: Callable[[pathlib.Path, str | None], None] | None = None,
+) -> None:
+    """
+    Poll changelog files and re-validate them whenever they change.
+
+    Polling only uses the standard library, so it works on every platform.
+    Runs until interrupted.
+
+    Args:
+        file_paths: Paths of the changelog files to watch.
+        interval: Seconds to wait between two polls.
+        callback: Called with the path and error message (or `None`) of each
+            file re-validated. Defaults to logging the result.
+
+    """
+    watcher = Watcher(file_paths)
+    while True:
+        for file, error in watcher.poll():
+            if callback:
+                callback(file, error)
+            elif error:
+                _logger.error(f"{file!s}: {error}")
+            else:
+                _logger.info(f"{file!s}: Changelog format validation was successful.")
+        time.sleep(interval)
@@ -1,5 +1,8 @@
+import semver
 from hypothesis import strategies as st
 
+from changelogtxt_parser import version
+
 version_st = st.builds(
     lambda major, minor, patch, post, dev: f"v{major}.{minor}.{patch}{post}{dev}",
     major=st.integers(min_value=0, max_value=99),
@@ -36,3 +39,28 @@ list_of_version_entries = st.one_of(
         unique_by=lambda entry: str(entry["version"]),
     ),
 )
+
+semver_st = st.builds(
+    lambda major, minor, patch, pre, build: f"v{major}.{minor}.{patch}-{pre}{build}",
+    major=st.integers(min_value=0, max_value=9),
+    minor=st.integers(min_value=0, max_value=9),
+    patch=st.integers(min_value=0, max_value=9),
+    pre=st.lists(
+        st.one_of(
+            st.sampled_from(["alpha", "beta", "rc", "a", "b", "x", "Alpha", "RC"]),
+            st.integers(min_value=0, max_value=20).map(str),
+            st.text(alphabet="abcxyzABC-", min_size=1, max_size=4),
+        ),
+        min_size=1,
+        max_size=3,
+    ).map(".".join),
+    build=st.one_of(st.just(""), st.just("+build.1")),
+).filter(lambda v: isinstance(version.parse_version(v), semver.Version))
+
+bad_version_st = st.builds(
+    lambda major, minor, micro, local: f"v{major}.{minor}.{micro}.{local}",
+    major=st.integers(min_value=0, max_value=9),
+    minor=st.integers(min_value=0, max_value=9),
+    micro=st.integers(min_value=0, max_value=9),
+    local=st.text(alphabet="xyz", min_size=1, max_size=3),
+).filter(lambda v: isinstance(version.parse_version(v), version.BadVersion))
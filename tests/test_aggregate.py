@@ -0,0 +1,67 @@
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from changelogtxt_parser import aggregate, app, serdes
+from tests import strategies as sts
+
+BASE_SETTINGS = settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+DEFAULT_FILE = "CHANGELOG.txt"
+
+
+class TestAggregate:
+    @BASE_SETTINGS
+    @given(
+        changelogs=st.lists(sts.list_of_version_entries, min_size=1, max_size=4),
+        unreleased=sts.list_of_strings,
+    )
+    def test_aggregate_matches_sorted_concatenation(
+        self,
+        changelogs,
+        unreleased,
+        tmp_path,
+    ):
+        files = []
+        expected: dict[str, list[str]] = {"": []}
+        for i, entries in enumerate(changelogs):
+            package = tmp_path / f"pkg{i}"
+            package.mkdir(exist_ok=True)
+            file = package / DEFAULT_FILE
+            with_unreleased = [{"version": "", "changes": unreleased}, *entries]
+            serdes.dump(app.sort_entries(with_unreleased), file)
+            files.append(file)
+            for entry in serdes.load(file):
+                expected.setdefault(entry["version"], []).extend(
+                    f"pkg{i}: {change}" for change in entry["changes"]
+                )
+
+        output = tmp_path / DEFAULT_FILE
+        aggregate.aggregate(files, output, prefix=True)
+        loaded = serdes.load(output)
+
+        assert loaded == app.sort_entries(loaded)
+        assert {e["version"]: e["changes"] for e in loaded} == expected
+
+    def test_equal_versions_are_combined(self, tmp_path):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("v1.1.0\n- A\n\nv1.0\n- B")
+        second.write_text("v1.2.0\n- C\n\n1.0.0\n- D")
+
+        assert list(aggregate.merge([first, second])) == [
+            {"version": "v1.2.0", "changes": ["C"]},
+            {"version": "v1.1.0", "changes": ["A"]},
+            {"version": "v1.0", "changes": ["B", "D"]},
+        ]
+
+    def test_equal_versions_in_one_file_are_combined(self, tmp_path):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("v1.0\n- A\n\n1.0.0\n- B")
+        second.write_text("v1.0.0\n- C")
+
+        assert list(aggregate.merge([first, second])) == [
+            {"version": "v1.0", "changes": ["A", "B", "C"]},
+        ]
@@ -3,7 +3,7 @@ import re
 import pytest
 from hypothesis import HealthCheck, assume, given, settings
 
-from changelogtxt_parser import app
+from changelogtxt_parser import app, serdes
 from tests import strategies as sts
 
 BASE_SETTINGS = settings(
@@ -112,6 +112,15 @@ class TestUpdate:
         assert message in updated_file
         assert message in second_line
 
+    def test_update_keeps_history_as_written(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        history = b"v1.0.1\r\n- Fixed a bug that was\r\n  wrapped by hand\r\n"
+        file.write_bytes(history)
+
+        app.update("v1.0.2", "New change", file)
+
+        assert file.read_bytes() == b"v1.0.2\r\n- New change\r\n\r\n" + history
+
     @BASE_SETTINGS
     @given(version=sts.version_st, message=sts.random_string)
     def test_update_unreleased_with_existing_changes(
@@ -196,3 +205,31 @@ class TestSummarizeNews:
 
         assert version in new_versions
         assert new_changes == {}
+
+
+class TestCheckOrder:
+    @BASE_SETTINGS
+    @given(entries=sts.list_of_version_entries)
+    def test_sorted_entries_pass_check_order(self, entries, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        serdes.dump(app.sort_entries(entries), file)
+
+        app.check_order(file)
+
+    def test_check_order_reports_errors(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text("v1.0.0\n- A\n\nv1.1.0\n- B\n\n1.0\n- C")
+
+        with pytest.raises(ValueError, match="Invalid changelog order") as e:
+            app.check_order(file)
+
+        assert "v1.1.0 is listed after older v1.0.0" in str(e.value)
+        assert "1.0 duplicates v1.0.0" in str(e.value)
+
+    def test_check_order_follows_semver_precedence(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text("v1.0.0-x\n- B\n\nv1.0.0-alpha.b\n- A")
+
+        app.check_order(file)
@@ -0,0 +1,129 @@
+import pytest
+from hypothesis import HealthCheck, given, settings
+
+from changelogtxt_parser import fulltext, serdes
+from tests import strategies as sts
+
+BASE_SETTINGS = settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+DEFAULT_FILE = "CHANGELOG.txt"
+CHANGELOG_CONTENT = (
+    "- Bump requests for CVE-2024-1234\n\n"
+    "v1.1.0\n- Fix security issue in requests\n- Pin urllib3\n\n"
+    "v1.0.0\n- Initial release with requests support"
+)
+
+
+class TestSearch:
+    @BASE_SETTINGS
+    @given(entries=sts.list_of_version_entries)
+    def test_search_finds_every_change(self, entries, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump(entries, file)
+
+        for entry in entries:
+            for change in entry["changes"]:
+                results = fulltext.search(change, [file])
+                assert {
+                    "file": str(file),
+                    "version": entry["version"],
+                    "change": change,
+                } in results
+
+    def test_search_and_phrase(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        assert [r["version"] for r in fulltext.search("requests", [file])] == [
+            "",
+            "v1.1.0",
+            "v1.0.0",
+        ]
+        assert [r["version"] for r in fulltext.search("REQUESTS fix", [file])] == [
+            "v1.1.0",
+        ]
+        assert fulltext.search('"requests fix"', [file]) == []
+        assert [r["version"] for r in fulltext.search("cve-2024-1234", [file])] == [
+            "",
+        ]
+
+    def test_search_version_range(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        assert [
+            r["version"] for r in fulltext.search("requests", [file], until="1.0.0")
+        ] == ["v1.0.0"]
+        assert [
+            r["version"] for r in fulltext.search("requests", [file], since="v1.1")
+        ] == ["", "v1.1.0"]
+
+    def test_persisted_index_is_invalidated(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        assert fulltext.search("urllib3", [file], persist=True)
+        assert (tmp_path / f"{DEFAULT_FILE}.search").exists()
+
+        file.write_text("v2.0.0\n- Drop urllib3\n")
+        results = fulltext.search("urllib3", [file], persist=True)
+
+        assert [r["change"] for r in results] == ["Drop urllib3"]
+
+    def test_phrase_uses_word_positions(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(
+            "v1.0.0\n- Fix the fix bug\n- Bug fix\n- Fix\n  bug\n- Rare bug fix"
+            + "\n- Fix bug, again" * 20,
+        )
+
+        results = fulltext.search('"fix bug"', [file])
+        # few candidates for "rare", where the phrase is looked up
+        rare = fulltext.search('rare "fix bug"', [file]) + fulltext.search(
+            'rare "bug fix"',
+            [file],
+        )
+
+        assert [r["change"] for r in results[:2]] == ["Fix the fix bug", "Fix bug"]
+        assert {r["change"] for r in results[2:]} == {"Fix bug, again"}
+        assert [r["change"] for r in rare] == ["Rare bug fix"]
+
+    @BASE_SETTINGS
+    @given(entries=sts.list_of_version_entries)
+    def test_persisted_index_matches_built_one(self, entries, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        serdes.dump([*serdes.loads(CHANGELOG_CONTENT), *entries], file)
+        queries = ["requests", '"fix security"', "cve-2024-1234 bump", "urllib3"]
+        queries += [change for entry in entries for change in entry["changes"]]
+
+        built = [fulltext.search(query, [file], persist=True) for query in queries]
+        with monkeypatch.context() as m:
+            # as in a new process, which must not build the index again
+            m.setattr(fulltext, "_indexes", {})
+            m.setattr(fulltext._Index, "build", None)  # noqa: SLF001
+            read = [fulltext.search(query, [file], persist=True) for query in queries]
+
+        assert read == built
+
+    def test_empty_query_raises_error(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        with pytest.raises(ValueError, match="Nothing to search"):
+            fulltext.search(" - ", [file])
+
+    def test_unwritable_persisted_index_is_skipped(self, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        def write(*_args):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(fulltext, "_write_sidecar", write)
+
+        results = fulltext.search("urllib3", [file], persist=True)
+
+        assert [r["version"] for r in results] == ["v1.1.0"]
@@ -0,0 +1,81 @@
+from hypothesis import HealthCheck, assume, given, settings
+
+from changelogtxt_parser import app, index, serdes
+from changelogtxt_parser import version as version_tools
+from tests import strategies as sts
+
+BASE_SETTINGS = settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+DEFAULT_FILE = "CHANGELOG.txt"
+ASSUME_LIST = ["v1.0.1", "v1.0.0"]
+CHANGELOG_CONTENT = "- Unreleased\n\nv1.0.1\n- Fixed bug\n\nv1.0.0\n- Initial release"
+
+
+class TestVersionKey:
+    @BASE_SETTINGS
+    @given(first=sts.version_st, second=sts.version_st)
+    def test_version_key_equal_iff_parse_equal(self, first, second):
+        same = version_tools.parse_version(first) == version_tools.parse_version(
+            second,
+        )
+
+        assert (index.version_key(first) == index.version_key(second)) == same
+
+    def test_version_key_ignores_prefix_and_trailing_zeros(self):
+        assert index.version_key("v1.0") == index.version_key("1.0.0")
+
+
+class TestSidecarIndex:
+    @BASE_SETTINGS
+    @given(entries=sts.list_of_version_entries)
+    def test_load_section_with_index_matches_load(self, entries, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump(entries, file)
+        serdes.build_index(file)
+
+        for entry in serdes.load(file):
+            assert serdes.load_section(file, entry["version"]) == entry
+        assert serdes.load_section(file, "v999.0.0") is None
+
+    @BASE_SETTINGS
+    @given(version=sts.version_st, message=sts.random_string)
+    def test_update_refreshes_index(self, version, message, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        assume(version not in ASSUME_LIST)
+        serdes.build_index(file)
+
+        app.update(version, message, file)
+        data = file.read_bytes()
+
+        assert index.read(file, data) is not None
+        assert app.get_tag(version, file)["changes"] == [message, "Unreleased"]
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.build_index(file)
+
+        file.write_text("v2.0.0\n- Rewritten\n\nv1.0.0\n- Initial release")
+        assert index.read(file, file.read_bytes()) is None
+
+        assert app.get_tag("v1.0.0", file)["changes"] == ["Initial release"]
+        assert app.get_tag("v2.0.0", file)["changes"] == ["Rewritten"]
+        assert index.read(file, file.read_bytes()) is not None
+
+    def test_stale_index_in_read_only_directory(self, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.build_index(file)
+        file.write_text("v2.0.0\n- Rewritten\n\nv1.0.0\n- Initial release")
+
+        def write(*_args):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(index, "write", write)
+
+        assert app.get_tag("v2.0.0", file)["changes"] == ["Rewritten"]
+        assert index.read(file, file.read_bytes()) is None
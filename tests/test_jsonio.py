@@ -0,0 +1,117 @@
+import io
+import json
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from changelogtxt_parser import jsonio, serdes
+from tests import strategies as sts
+
+BASE_SETTINGS = settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+CHANGELOG_CONTENT = "v1.0.1\n- Fixed bug\n\nv1.0.0\n- Initial release"
+DEFAULT_FILE = "CHANGELOG.txt"
+
+
+class TestJson:
+    @BASE_SETTINGS
+    @given(
+        entries=sts.list_of_version_entries,
+        fmt=st.sampled_from(jsonio.FORMATS),
+    )
+    def test_export_import_roundtrip(self, entries, fmt, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump(entries, file)
+        output = tmp_path / f"changelog.{fmt}"
+        imported = tmp_path / "IMPORTED.txt"
+
+        jsonio.export(file, output, fmt=fmt)
+        jsonio.import_(output, imported, fmt=fmt)
+
+        assert serdes.load(imported) == serdes.load(file)
+        assert imported.read_text() == file.read_text()
+
+    def test_export_formats(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        output = tmp_path / "changelog.json"
+
+        jsonio.export(file, output, fmt="jsonl")
+        lines = output.read_text().splitlines()
+        assert [json.loads(line)["version"] for line in lines] == ["v1.0.1", "v1.0.0"]
+
+        jsonio.export(file, output, fmt="json")
+        assert json.loads(output.read_text()) == serdes.load(file)
+
+    @pytest.mark.parametrize("block_size", [1, 7, 1024])
+    def test_read_array_in_blocks(self, block_size, monkeypatch):
+        entries = [
+            {"version": "v1.0.1", "changes": ['Fixed [bug], "quoted"']},
+            {"version": "", "changes": []},
+        ]
+        monkeypatch.setattr(jsonio, "_BLOCK_SIZE", block_size)
+
+        f = io.StringIO(json.dumps(entries, indent=4))
+        assert list(jsonio.read(f, fmt="json")) == entries
+        assert list(jsonio.read(io.StringIO(" [ ] "), fmt="json")) == []
+
+    @pytest.mark.parametrize(
+        ("text", "fmt", "match"),
+        [
+            ('{"version": "v1"}', "json", "expected an array"),
+            ('[{"version": "v1", "changes": []} {}]', "json", "expected ','"),
+            ('[{"version": "v1", "changes": []}] []', "json", "after the array"),
+            ('[{"version": "v1", "changes": [1]}]', "json", "Invalid entry number 1"),
+            ('{"version": "v1", "changes": []}\n{', "jsonl", "at line 2"),
+            ('\n["v1"]', "jsonl", "Invalid entry at line 2"),
+        ],
+    )
+    def test_invalid_input_raises_error(self, text, fmt, match):
+        with pytest.raises(ValueError, match=match):
+            list(jsonio.read(io.StringIO(text), fmt=fmt))
+
+    def test_unknown_format_raises_error(self):
+        with pytest.raises(ValueError, match="Unknown format"):
+            jsonio.read(io.StringIO("[]"), fmt="yaml")
+
+    @pytest.mark.parametrize(
+        ("content", "error"),
+        [(None, FileNotFoundError), ("v1.0.0\n- Fixed\nv0.9.0\nNo bullet", ValueError)],
+    )
+    def test_failed_export_keeps_output(self, content, error, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        if content is not None:
+            file.write_text(content)
+        output = tmp_path / "changelog.json"
+        output.write_text("[]\n")
+
+        with pytest.raises(error):
+            jsonio.export(file, output)
+
+        assert output.read_text() == "[]\n"
+        assert sorted(tmp_path.iterdir()) == sorted(
+            [output, *([file] if content is not None else [])],
+        )
+
+    def test_export_to_the_changelog_itself(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        entries = serdes.load(file)
+
+        jsonio.export(file, file, fmt="jsonl")
+
+        assert [json.loads(line) for line in file.read_text().splitlines()] == entries
+
+    def test_export_expands_user(self, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        jsonio.export(file, "~/changelog.json")
+
+        output = tmp_path / "changelog.json"
+        assert json.loads(output.read_text()) == serdes.load(file)
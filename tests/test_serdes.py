@@ -1,5 +1,6 @@
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import HealthCheck, assume, given, settings
+from hypothesis import strategies as st
 
 from changelogtxt_parser import serdes
 from tests import strategies as sts
@@ -28,6 +29,46 @@ class TestRoundtrip:
 
         assert loaded == entries
 
+    @pytest.mark.parametrize(
+        ("entries", "expected"),
+        [
+            ([{"version": "bad", "changes": [""]}], "bad"),
+            ([{"version": "v1", "changes": [" ", "x"]}], "v1\n\n- x"),
+            (
+                [{"version": "", "changes": [""]}, {"version": "v1", "changes": []}],
+                "v1",
+            ),
+            ([{"version": "v1", "changes": []}, {"version": "", "changes": []}], "v1"),
+            (
+                [
+                    {"version": "v2", "changes": []},
+                    {"version": "", "changes": []},
+                    {"version": "v1", "changes": []},
+                ],
+                "v2\n\n\n\nv1",
+            ),
+        ],
+    )
+    def test_dump_strips_like_joined_text(self, entries, expected, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+
+        serdes.dump(entries, file)
+
+        assert file.read_text() == expected
+
+    def test_dump_keeps_symlink(self, tmp_path):
+        target = tmp_path / "docs" / DEFAULT_FILE
+        target.parent.mkdir()
+        target.write_text(CHANGELOG_CONTENT)
+        link = tmp_path / DEFAULT_FILE
+        link.symlink_to(target)
+
+        serdes.dump([{"version": "v2.0.0", "changes": ["New"]}], link)
+
+        assert link.is_symlink()
+        assert target.read_text() == "v2.0.0\n- New"
+        assert list(target.parent.iterdir()) == [target]
+
     def test_empty_bullet_raises_error(self, tmp_path):
         file = tmp_path / DEFAULT_FILE
         file.write_text("v1.0.0\n-\n- Valid change")
@@ -49,3 +90,145 @@ class TestRoundtrip:
             ),
         ):
             serdes.load(file)
+
+
+class TestBlockRead:
+    @BASE_SETTINGS
+    @given(
+        entries=sts.list_of_version_entries,
+        newline=st.sampled_from(["\n", "\r\n", "\r"]),
+        bom=st.booleans(),
+        block_size=st.integers(min_value=1, max_value=16),
+    )
+    def test_load_ignores_newlines_and_blocks(  # noqa: PLR0913, PLR0917
+        self,
+        entries,
+        newline,
+        bom,
+        block_size,
+        tmp_path,
+        monkeypatch,
+    ):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump(entries, file)
+        text = file.read_text().replace("\n", newline)
+        file.write_bytes(("\ufeff" if bom else "").encode() + text.encode())
+        monkeypatch.setattr(serdes, "_BLOCK_SIZE", block_size)
+
+        assert serdes.load(file) == entries
+        assert list(serdes.iter_load(file, block_size=block_size)) == entries
+        assert serdes.loads(text) == entries
+
+    def test_error_line_number_with_crlf(self, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        file.write_bytes(
+            b"\xef\xbb\xbfv1.0.0\r\n- \xc3\xa9\r\n\r\nv0.9.0\rNo bullet\r\n"
+        )
+        monkeypatch.setattr(serdes, "_BLOCK_SIZE", 3)
+
+        with pytest.raises(
+            ValueError,
+            match="Invalid changelog format at line 5",
+        ):
+            serdes.load(file)
+
+
+class TestSections:
+    @BASE_SETTINGS
+    @given(
+        entries=sts.list_of_version_entries,
+        newline=st.sampled_from(["\n", "\r\n", "\r"]),
+        trailing=st.sampled_from(["", "\n", "\n\n"]),
+    )
+    def test_dump_unchanged_sections_is_lossless(
+        self,
+        entries,
+        newline,
+        trailing,
+        tmp_path,
+    ):
+        assume(entries)
+        file = tmp_path / DEFAULT_FILE
+        # wrap every change by hand, as dump would never do
+        text = "\n\n".join(
+            "\n".join(
+                [entry["version"]]
+                + [
+                    f"-  {change[:4]}\n     {change[4:]}" for change in entry["changes"]
+                ],
+            )
+            for entry in entries
+        )
+        file.write_bytes((text + trailing).replace("\n", newline).encode())
+        original = file.read_bytes()
+
+        sections = serdes.load_sections(file)
+        assert [section.entry for section in sections] == serdes.load(file)
+
+        serdes.dump([section.entry for section in sections], file, sections=sections)
+        assert file.read_bytes() == original
+
+    def test_dump_only_formats_new_text(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_bytes(
+            b"- Unreleased\r\n  change\r\n\r\nv1.0.0\r\n-   Initial\r\n    release",
+        )
+        sections = serdes.load_sections(file)
+        entries = [section.entry for section in sections]
+        entries[0]["version"] = "v1.1.0"
+        entries[0]["changes"].insert(0, "New")
+        entries.append({"version": "v0.1.0", "changes": ["Prototype"]})
+
+        serdes.dump(entries, file, sections=sections)
+
+        assert file.read_bytes() == (
+            b"v1.1.0\r\n- New\r\n- Unreleased\r\n  change\r\n\r\n"
+            b"v1.0.0\r\n-   Initial\r\n    release\r\n\r\nv0.1.0\r\n- Prototype"
+        )
+
+
+class TestLoadParallel:
+    @BASE_SETTINGS
+    @given(
+        entries=sts.list_of_version_entries,
+        unreleased=sts.list_of_strings,
+        broken=st.booleans(),
+    )
+    def test_load_parallel_matches_load(
+        self,
+        entries,
+        unreleased,
+        broken,
+        tmp_path,
+    ):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump([{"version": "", "changes": unreleased}, *entries], file)
+        if broken:
+            file.write_text(file.read_text() + "\r\nv0.0.0\r\nNo bullet")
+
+        try:
+            expected = serdes.load(file)
+        except ValueError as e:
+            error = str(e)
+        else:
+            assert serdes.load_parallel(file, workers=2, min_chunk_size=32) == expected
+            return
+
+        with pytest.raises(ValueError, match=error) as info:
+            serdes.load_parallel(file, workers=2, min_chunk_size=32)
+        # only the error with the line number in the whole file is shown
+        assert info.value.__context__ is None
+
+    def test_unicode_digit_headers_agree(self, tmp_path):
+        version = "\u0661.\u0662"  # Arabic-Indic digits, a `BadVersion`
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(f"v2.0.0\n- New\n\n{version}\n- Other\n\nv1.0.0\n- Initial")
+        serdes.build_index(file)
+
+        entries = serdes.load(file)
+
+        assert [entry["version"] for entry in entries] == ["v2.0.0", version, "v1.0.0"]
+        assert serdes.load_parallel(file, workers=2, min_chunk_size=8) == entries
+        assert serdes.load_section(file, version) == entries[1]
@@ -0,0 +1,129 @@
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from changelogtxt_parser import _cli, app, client, jsonio, server
+
+DEFAULT_FILE = "CHANGELOG.txt"
+CHANGELOG_CONTENT = "v1.0.1\n- Fixed bug\n\nv1.0.0\n- Initial release"
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "s.sock")
+    thread = threading.Thread(
+        target=server.serve,
+        args=(path,),
+        kwargs={"idle_timeout": 10},
+        daemon=True,
+    )
+    thread.start()
+    for _ in range(100):
+        try:
+            client.request("ping", path)
+            break
+        except OSError:
+            time.sleep(0.01)
+    yield path
+    client.request("shutdown", path)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+class TestServer:
+    def test_get_tag_matches_app(self, socket_path, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+
+        result = client.request("get-tag", socket_path, tag="1.0.0", file=str(file))
+
+        assert result == app.get_tag("1.0.0", file)
+        with pytest.raises(ValueError, match="not found in changelog"):
+            client.request("get-tag", socket_path, tag="v2.0.0", file=str(file))
+
+    def test_update_is_visible_to_next_request(self, socket_path, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        client.request("check-format", socket_path, file=str(file))
+
+        client.request(
+            "update",
+            socket_path,
+            tag="v1.0.2",
+            message="New",
+            file=str(file),
+        )
+        result = client.request("get-tag", socket_path, tag="v1.0.2", file=str(file))
+
+        assert result == {"version": "v1.0.2", "changes": ["New"]}
+
+    def test_summarize_news_returns_sets(self, socket_path, tmp_path):
+        source_file = tmp_path / "source.txt"
+        target_file = tmp_path / "target.txt"
+        source_file.write_text(CHANGELOG_CONTENT)
+        target_file.write_text(f"v1.0.2\n- New\n\n{CHANGELOG_CONTENT}")
+
+        result = client.request(
+            "summarize-news",
+            socket_path,
+            source=str(source_file),
+            target=str(target_file),
+        )
+
+        assert result == app.summarize_news(source_file, target_file)
+
+    def test_errors_are_reraised(self, socket_path, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text("v1.0.0\nValid change")
+
+        with pytest.raises(ValueError, match="Invalid changelog format at line 2"):
+            client.request("check-format", socket_path, file=str(file))
+        with pytest.raises(FileNotFoundError, match="File not found:"):
+            client.request("check-format", socket_path, file=str(tmp_path / "x.txt"))
+        with pytest.raises(ValueError, match="standard input"):
+            client.request("check-format", socket_path, file="-")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [b"[1, 2]\n", b'{"command": "get-tag", "tag": 1, "file": "x"}\n', b"{\n"],
+    )
+    def test_malformed_requests_get_an_error(self, socket_path, payload):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            for _ in range(2):  # the connection is still served after an error
+                sock.sendall(payload)
+                response = json.loads(sock.makefile("rb").readline())
+                assert response["ok"] is False
+
+    def test_idle_timeout_stops_server(self, tmp_path):
+        path = str(tmp_path / "idle.sock")
+        thread = threading.Thread(
+            target=server.serve,
+            args=(path,),
+            kwargs={"idle_timeout": 0.1},
+        )
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not (tmp_path / "idle.sock").exists()
+
+    def test_cli_client_does_not_import_the_parser(self):
+        code = (
+            "import sys, changelogtxt_parser._cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('changelogtxt')))"
+        )
+        out = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        assert out.strip() == "['changelogtxt_parser', 'changelogtxt_parser._cli']"
+        assert _cli._FORMATS == jsonio.FORMATS  # noqa: SLF001
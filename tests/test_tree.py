@@ -0,0 +1,77 @@
+import subprocess
+
+import pytest
+
+from changelogtxt_parser import app, tree
+
+DEFAULT_FILE = "CHANGELOG.txt"
+CHANGELOG_CONTENT = "v1.0.1\n- Fixed bug\n\nv1.0.0\n- Initial release"
+NEW_CONTENT = f"v1.0.2\n- New\n\n{CHANGELOG_CONTENT}"
+
+
+def _write_tree(root, files):
+    for path, content in files.items():
+        file = root / path / DEFAULT_FILE
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content)
+
+
+def _git(repo, *args):
+    subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],  # noqa: S607
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestSummarizeTree:
+    def test_summarize_dirs(self, tmp_path):
+        source, target = tmp_path / "source", tmp_path / "target"
+        _write_tree(source, {".": CHANGELOG_CONTENT, "a": CHANGELOG_CONTENT})
+        _write_tree(
+            target,
+            {".": CHANGELOG_CONTENT, "a": NEW_CONTENT, "b": CHANGELOG_CONTENT},
+        )
+
+        report = tree.summarize_dirs(source, target, workers=2)
+
+        assert report == {
+            "a/CHANGELOG.txt": app.summarize_news(
+                source / "a" / DEFAULT_FILE,
+                target / "a" / DEFAULT_FILE,
+            ),
+            "b/CHANGELOG.txt": ({"v1.0.1", "v1.0.0"}, {}),
+        }
+
+    def test_summarize_revisions(self, tmp_path):
+        _write_tree(tmp_path, {".": CHANGELOG_CONTENT, "a": CHANGELOG_CONTENT})
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-qm", "base")
+        _write_tree(tmp_path, {"a": NEW_CONTENT, "b/c": CHANGELOG_CONTENT})
+        (tmp_path / DEFAULT_FILE).unlink()
+        _git(tmp_path, "add", "-A")
+        _git(tmp_path, "commit", "-qm", "head")
+
+        report = tree.summarize_revisions("HEAD~1", "HEAD", repo=str(tmp_path))
+
+        assert report == {
+            "a/CHANGELOG.txt": ({"v1.0.2"}, {}),
+            "b/c/CHANGELOG.txt": ({"v1.0.1", "v1.0.0"}, {}),
+        }
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_invalid_changelog_names_its_path(self, workers, tmp_path):
+        source, target = tmp_path / "source", tmp_path / "target"
+        _write_tree(source, {"a": CHANGELOG_CONTENT, "b": CHANGELOG_CONTENT})
+        _write_tree(target, {"a": NEW_CONTENT, "b": "v1.0.0\nNo bullet"})
+
+        with pytest.raises(ValueError, match=r"^b/CHANGELOG\.txt: Invalid changelog"):
+            tree.summarize_dirs(source, target, workers=workers)
+
+    def test_missing_root_raises_error(self, tmp_path):
+        _write_tree(tmp_path, {".": CHANGELOG_CONTENT})
+
+        with pytest.raises(FileNotFoundError, match="Directory not found"):
+            tree.summarize_dirs(tmp_path / "missing", tmp_path)
@@ -1,5 +1,7 @@
+import pytest
 import semver
-from hypothesis import given, settings
+from hypothesis import assume, given, settings
+from hypothesis import strategies as st
 from packaging import version as pyversion
 
 from changelogtxt_parser import version as version_tools
@@ -8,6 +10,16 @@ from tests import strategies as sts
 BASE_SETTINGS = settings(max_examples=30)
 
 
+def _release(parsed):
+    if isinstance(parsed, pyversion.Version):
+        numbers = parsed.release
+    elif isinstance(parsed, semver.Version):
+        numbers = (parsed.major, parsed.minor, parsed.patch)
+    else:
+        numbers = (parsed.major, parsed.minor, parsed.micro)
+    return pyversion.Version(".".join(map(str, numbers)))
+
+
 class TestParseVersion:
     @BASE_SETTINGS
     @given(version=sts.version_st)
@@ -28,3 +40,74 @@ class TestParseVersion:
         result = version_tools.parse_version("malformed")
 
         assert result is None
+
+
+class TestSortKey:
+    @BASE_SETTINGS
+    @given(first=sts.version_st, second=sts.version_st)
+    def test_sort_key_matches_parsed_order(self, first, second):
+        first_ver = version_tools.parse_version(first)
+        second_ver = version_tools.parse_version(second)
+        first_key = version_tools.sort_key(first)
+        second_key = version_tools.sort_key(second)
+
+        assert (first_key < second_key) == (first_ver < second_ver)
+        assert (first_key == second_key) == (first_ver == second_ver)
+
+    @BASE_SETTINGS
+    @given(first=sts.semver_st, second=sts.semver_st)
+    def test_sort_key_matches_semver_precedence(self, first, second):
+        order = semver.Version.parse(first[1:]).compare(second[1:])
+        first_key = version_tools.sort_key(first)
+        second_key = version_tools.sort_key(second)
+
+        assert (first_key > second_key) - (first_key < second_key) == order
+
+    @BASE_SETTINGS
+    @given(
+        first=st.one_of(sts.version_st, sts.semver_st, sts.bad_version_st),
+        second=st.one_of(sts.version_st, sts.semver_st, sts.bad_version_st),
+    )
+    def test_sort_key_orders_releases_of_any_type(self, first, second):
+        first_release = _release(version_tools.parse_version(first))
+        second_release = _release(version_tools.parse_version(second))
+        assume(first_release != second_release)
+
+        assert (version_tools.sort_key(first) < version_tools.sort_key(second)) == (
+            first_release < second_release
+        )
+
+    def test_sort_key_orders_mixed_types(self):
+        versions = [
+            "1.0.0.dev1",
+            "1.0.0-alpha.x",
+            "v1.0.0a1",
+            "1.0.0rc1",
+            "1.0",
+            "1.0.0+local",
+            "1.0.0.post1",
+            "1.1.0-beta.x",
+            "1.1.0-beta.2",
+            "1.1.0",
+        ]
+        assert isinstance(version_tools.parse_version("1.0.0-alpha.x"), semver.Version)
+
+        assert sorted(versions, key=version_tools.sort_key) == versions
+        assert version_tools.sort_key("v1.0") == version_tools.sort_key("1.0.0")
+        assert version_tools.sort_key("v1.0.0-x") > version_tools.sort_key(
+            "v1.0.0-alpha.b",
+        )
+
+    def test_sort_key_raises_on_malformed(self):
+        with pytest.raises(ValueError, match="Poorly formatted version value"):
+            version_tools.sort_key("malformed")
+
+    @pytest.mark.parametrize("local", ["²", "٣", "x²"])
+    def test_sort_key_accepts_unicode_digits_in_local_part(self, local):
+        version = f"1.2.3.{local}"  # superscript or Arabic-Indic digits
+        assert isinstance(
+            version_tools.parse_version(version), version_tools.BadVersion
+        )
+
+        assert version_tools.sort_key("1.2.3") < version_tools.sort_key(version)
+        assert version_tools.sort_key(version) < version_tools.sort_key("1.2.4")
@@ -0,0 +1,71 @@
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from changelogtxt_parser import serdes, watch
+from tests import strategies as sts
+
+BASE_SETTINGS = settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+DEFAULT_FILE = "CHANGELOG.txt"
+CHANGELOG_CONTENT = "- Unreleased\n\nv1.0.1\n- Fixed bug\n\nv1.0.0\n- Initial release"
+
+
+class TestWatcher:
+    @BASE_SETTINGS
+    @given(
+        entries=sts.list_of_version_entries,
+        position=st.floats(min_value=0, max_value=1),
+        insert=st.sampled_from(["- Added\n", "  more text\n", "v9.9.9\n", "x", "\n"]),
+    )
+    def test_incremental_check_matches_load(
+        self,
+        entries,
+        position,
+        insert,
+        tmp_path,
+    ):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        serdes.dump(entries, file)
+        watcher = watch.Watcher([file])
+        assert watcher.check(file) == serdes.load(file)
+
+        content = file.read_text()
+        cut = int(len(content) * position)
+        file.write_text(content[:cut] + insert + content[cut:])
+
+        try:
+            expected = serdes.load(file)
+        except ValueError as e:
+            with pytest.raises(ValueError, match=str(e)):
+                watcher.check(file)
+        else:
+            assert watcher.check(file) == expected
+
+    def test_error_then_fix(self, tmp_path):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT)
+        watcher = watch.Watcher([file])
+        assert watcher.poll() == [(file, None)]
+        assert watcher.poll() == []
+
+        file.write_text(CHANGELOG_CONTENT.replace("- Fixed", "Fixed"))
+        with pytest.raises(ValueError, match="at line 4"):
+            watcher.check(file)
+
+        file.write_text(CHANGELOG_CONTENT + "\n- Second")
+        assert watcher.check(file) == serdes.load(file)
+
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path, monkeypatch):
+        file = tmp_path / DEFAULT_FILE
+        file.write_text(CHANGELOG_CONTENT.replace("- Fixed", "Fixed"))
+        watcher = watch.Watcher([file])
+        with pytest.raises(ValueError, match="at line 4") as info:
+            watcher.check(file)
+
+        monkeypatch.setattr(serdes, "parse_lines", None)
+        file.touch()
+        assert watcher.poll() == [(file, str(info.value))]